@@ -0,0 +1,37 @@
+"""add sync state
+
+Revision ID: 8f2d4b1c9a73
+Revises: 5cac43158c64
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '8f2d4b1c9a73'
+down_revision: Union[str, None] = '5cac43158c64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create sync_state table (per-entity write_date watermarks)
+    op.create_table('sync_state',
+    sa.Column('entity', sa.VARCHAR(length=50), autoincrement=False, nullable=False),
+    sa.Column('last_write_date', postgresql.TIMESTAMP(timezone=True), autoincrement=False, nullable=True),
+    sa.Column('last_odoo_id', sa.INTEGER(), autoincrement=False, nullable=True),
+    sa.Column('last_full_sync_at', postgresql.TIMESTAMP(timezone=True), autoincrement=False, nullable=True),
+    sa.Column('last_sync_at', postgresql.TIMESTAMP(timezone=True), autoincrement=False, nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), autoincrement=False, nullable=False),
+    sa.Column('updated_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), autoincrement=False, nullable=False),
+    sa.PrimaryKeyConstraint('entity', name=op.f('sync_state_pkey'))
+    )
+
+
+def downgrade() -> None:
+    # Drop sync_state table
+    op.drop_table('sync_state')
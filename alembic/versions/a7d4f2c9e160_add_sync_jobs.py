@@ -0,0 +1,49 @@
+"""add sync jobs
+
+Revision ID: a7d4f2c9e160
+Revises: f8c1a3e6b952
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d4f2c9e160'
+down_revision: Union[str, None] = 'f8c1a3e6b952'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create sync_jobs table (entity syncs queued for worker processes)
+    op.create_table('sync_jobs',
+    sa.Column('id', sa.INTEGER(), autoincrement=True, nullable=False),
+    sa.Column('entity', sa.VARCHAR(length=50), autoincrement=False, nullable=False),
+    sa.Column('full', sa.BOOLEAN(), autoincrement=False, nullable=True),
+    sa.Column('status', sa.VARCHAR(length=20), autoincrement=False, nullable=False),
+    sa.Column('attempts', sa.INTEGER(), autoincrement=False, nullable=False),
+    sa.Column('run_after', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), autoincrement=False, nullable=False),
+    sa.Column('worker_id', sa.VARCHAR(length=100), autoincrement=False, nullable=True),
+    sa.Column('heartbeat_at', postgresql.TIMESTAMP(timezone=True), autoincrement=False, nullable=True),
+    sa.Column('started_at', postgresql.TIMESTAMP(timezone=True), autoincrement=False, nullable=True),
+    sa.Column('finished_at', postgresql.TIMESTAMP(timezone=True), autoincrement=False, nullable=True),
+    sa.Column('error', sa.TEXT(), autoincrement=False, nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), autoincrement=False, nullable=False),
+    sa.Column('updated_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), autoincrement=False, nullable=False),
+    sa.PrimaryKeyConstraint('id', name=op.f('sync_jobs_pkey'))
+    )
+    # At most one queued or running job per entity
+    op.create_index('uq_sync_jobs_active_entity', 'sync_jobs', ['entity'], unique=True,
+                    postgresql_where=sa.text("status IN ('pending', 'running')"))
+    op.create_index('ix_sync_jobs_status_run_after', 'sync_jobs', ['status', 'run_after'], unique=False)
+
+
+def downgrade() -> None:
+    # Drop sync_jobs table
+    op.drop_index('ix_sync_jobs_status_run_after', table_name='sync_jobs')
+    op.drop_index('uq_sync_jobs_active_entity', table_name='sync_jobs')
+    op.drop_table('sync_jobs')
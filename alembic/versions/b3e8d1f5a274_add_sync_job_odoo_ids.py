@@ -0,0 +1,35 @@
+"""add sync job odoo ids
+
+Revision ID: b3e8d1f5a274
+Revises: a7d4f2c9e160
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e8d1f5a274'
+down_revision: Union[str, None] = 'a7d4f2c9e160'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Record jobs (webhook notifications) sync only these Odoo IDs
+    op.add_column('sync_jobs', sa.Column('odoo_ids', postgresql.ARRAY(sa.INTEGER()), autoincrement=False, nullable=True))
+    # Only entity jobs are limited to one queued or running job per entity
+    op.drop_index('uq_sync_jobs_active_entity', table_name='sync_jobs')
+    op.create_index('uq_sync_jobs_active_entity', 'sync_jobs', ['entity'], unique=True,
+                    postgresql_where=sa.text("status IN ('pending', 'running') AND odoo_ids IS NULL"))
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM sync_jobs WHERE odoo_ids IS NOT NULL")
+    op.drop_index('uq_sync_jobs_active_entity', table_name='sync_jobs')
+    op.create_index('uq_sync_jobs_active_entity', 'sync_jobs', ['entity'], unique=True,
+                    postgresql_where=sa.text("status IN ('pending', 'running')"))
+    op.drop_column('sync_jobs', 'odoo_ids')
@@ -0,0 +1,35 @@
+"""add row fingerprints
+
+Revision ID: b4e1a7c02d58
+Revises: 8f2d4b1c9a73
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e1a7c02d58'
+down_revision: Union[str, None] = '8f2d4b1c9a73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Content hash of synced fields, used to skip no-op updates
+    op.add_column('contacts', sa.Column('fingerprint', sa.VARCHAR(length=32), autoincrement=False, nullable=True))
+    op.add_column('invoices', sa.Column('fingerprint', sa.VARCHAR(length=32), autoincrement=False, nullable=True))
+
+    # Staging tables are created by the bulk loader from the table columns;
+    # drop them so they are recreated with the new column
+    op.execute('DROP TABLE IF EXISTS contacts_staging')
+    op.execute('DROP TABLE IF EXISTS invoices_staging')
+
+
+def downgrade() -> None:
+    op.execute('DROP TABLE IF EXISTS invoices_staging')
+    op.execute('DROP TABLE IF EXISTS contacts_staging')
+    op.drop_column('invoices', 'fingerprint')
+    op.drop_column('contacts', 'fingerprint')
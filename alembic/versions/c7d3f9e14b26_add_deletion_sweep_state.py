@@ -0,0 +1,27 @@
+"""add deletion sweep state
+
+Revision ID: c7d3f9e14b26
+Revises: b4e1a7c02d58
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d3f9e14b26'
+down_revision: Union[str, None] = 'b4e1a7c02d58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Last id-only deletion sweep per entity
+    op.add_column('sync_state', sa.Column('last_deletion_sweep_at', postgresql.TIMESTAMP(timezone=True), autoincrement=False, nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('sync_state', 'last_deletion_sweep_at')
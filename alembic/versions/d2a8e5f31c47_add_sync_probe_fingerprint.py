@@ -0,0 +1,26 @@
+"""add sync probe fingerprint
+
+Revision ID: d2a8e5f31c47
+Revises: c7d3f9e14b26
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a8e5f31c47'
+down_revision: Union[str, None] = 'c7d3f9e14b26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Odoo count/write_date probe used to skip runs when nothing changed
+    op.add_column('sync_state', sa.Column('probe_fingerprint', sa.VARCHAR(length=64), autoincrement=False, nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('sync_state', 'probe_fingerprint')
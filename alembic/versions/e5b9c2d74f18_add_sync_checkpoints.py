@@ -0,0 +1,39 @@
+"""add sync checkpoints
+
+Revision ID: e5b9c2d74f18
+Revises: d2a8e5f31c47
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b9c2d74f18'
+down_revision: Union[str, None] = 'd2a8e5f31c47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create sync_checkpoints table (progress of unfinished full syncs)
+    op.create_table('sync_checkpoints',
+    sa.Column('entity', sa.VARCHAR(length=50), autoincrement=False, nullable=False),
+    sa.Column('started_at', postgresql.TIMESTAMP(timezone=True), autoincrement=False, nullable=False),
+    sa.Column('bulk', sa.BOOLEAN(), autoincrement=False, nullable=False),
+    sa.Column('last_odoo_id', sa.INTEGER(), autoincrement=False, nullable=False),
+    sa.Column('records_done', sa.INTEGER(), autoincrement=False, nullable=False),
+    sa.Column('watermark_write_date', postgresql.TIMESTAMP(timezone=True), autoincrement=False, nullable=True),
+    sa.Column('watermark_odoo_id', sa.INTEGER(), autoincrement=False, nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), autoincrement=False, nullable=False),
+    sa.Column('updated_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), autoincrement=False, nullable=False),
+    sa.PrimaryKeyConstraint('entity', name=op.f('sync_checkpoints_pkey'))
+    )
+
+
+def downgrade() -> None:
+    # Drop sync_checkpoints table
+    op.drop_table('sync_checkpoints')
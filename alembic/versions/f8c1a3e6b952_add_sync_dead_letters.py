@@ -0,0 +1,37 @@
+"""add sync dead letters
+
+Revision ID: f8c1a3e6b952
+Revises: e5b9c2d74f18
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8c1a3e6b952'
+down_revision: Union[str, None] = 'e5b9c2d74f18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create sync_dead_letters table (records that failed to sync, retried by id)
+    op.create_table('sync_dead_letters',
+    sa.Column('entity', sa.VARCHAR(length=50), autoincrement=False, nullable=False),
+    sa.Column('odoo_id', sa.INTEGER(), autoincrement=False, nullable=False),
+    sa.Column('error_class', sa.VARCHAR(length=100), autoincrement=False, nullable=False),
+    sa.Column('error_message', sa.TEXT(), autoincrement=False, nullable=False),
+    sa.Column('attempts', sa.INTEGER(), autoincrement=False, nullable=False),
+    sa.Column('created_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), autoincrement=False, nullable=False),
+    sa.Column('updated_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), autoincrement=False, nullable=False),
+    sa.PrimaryKeyConstraint('entity', 'odoo_id', name=op.f('sync_dead_letters_pkey'))
+    )
+
+
+def downgrade() -> None:
+    # Drop sync_dead_letters table
+    op.drop_table('sync_dead_letters')
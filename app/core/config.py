@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -7,12 +9,56 @@ class Settings(BaseSettings):
     odoo_db: str
     odoo_username: str
     odoo_password: str
+    odoo_transport: Literal["xmlrpc", "jsonrpc"] = "xmlrpc"
 
     # Database Configuration
     database_url: str
+    # Bounds how long startup and readiness checks wait for an unreachable database
+    database_connect_timeout_seconds: int = 5
 
     # Sync Configuration
     sync_interval_minutes: int = 15
+    sync_batch_size: int = 500
+    sync_transaction_size: int = 5000
+    sync_bulk_load: bool = False
+    sync_skip_unchanged: bool = True
+    sync_dead_letter_max_attempts: int = 5
+    full_sync_interval_hours: int = 24
+    # Incremental runs re-read this far behind the watermark, to catch writes
+    # whose transaction committed after a later write_date was already synced
+    sync_watermark_lookback_seconds: int = 300
+    deletion_sweep_interval_minutes: int = 60
+    odoo_page_size: int = 1000
+    odoo_min_page_size: int = 100
+    odoo_max_page_size: int = 5000
+    odoo_target_latency_seconds: float = 10.0
+    odoo_call_timeout_seconds: float = 120.0
+    odoo_max_retries: int = 4
+    odoo_retry_backoff_seconds: float = 1.0
+    odoo_fetch_workers: int = 4
+    odoo_max_concurrent_requests: int = 8
+    sync_max_concurrency: int = 2
+    sync_async: bool = False
+
+    # Sync Job Queue (app.worker)
+    sync_queue_enabled: bool = False
+    sync_worker_poll_seconds: float = 5.0
+    sync_worker_heartbeat_seconds: float = 30.0
+    sync_job_stale_seconds: int = 300
+    sync_job_max_attempts: int = 3
+    sync_job_retention_days: int = 7
+    # Jobs whose entity is being synced elsewhere wait as long as they have been
+    # queued (at least one poll), up to this long
+    sync_job_max_postpone_seconds: float = 300.0
+
+    # Odoo Webhooks (push sync); the endpoint is disabled without a secret
+    webhook_secret: str | None = None
+    webhook_debounce_seconds: float = 2.0
+    webhook_max_delay_seconds: float = 10.0
+    webhook_max_batch_size: int = 5000
+    # Batches of an entity that is being synced elsewhere are retried with
+    # exponential backoff from the debounce delay up to this long
+    webhook_max_postpone_seconds: float = 300.0
 
     # API Security
     secret_key: str
@@ -1,6 +1,7 @@
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
@@ -12,6 +13,7 @@ engine = create_engine(
     pool_pre_ping=True,  # Verify connections before using them
     pool_size=5,
     max_overflow=10,
+    connect_args={"connect_timeout": settings.database_connect_timeout_seconds},
 )
 
 # Create session factory
@@ -38,3 +40,24 @@ def init_db() -> None:
     from models import Base
 
     Base.metadata.create_all(bind=engine)
+
+
+@contextmanager
+def advisory_lock(key: int) -> Iterator[bool]:
+    """
+    Try to take a session-level PostgreSQL advisory lock without waiting.
+
+    The lock lives on a dedicated connection for the duration of the block and
+    is released on exit (or by Postgres if the connection drops). Yields
+    whether it was acquired.
+    """
+    with engine.connect() as connection:
+        acquired = connection.scalar(text("SELECT pg_try_advisory_lock(:key)"), {"key": key})
+        # Don't leave the lock query's transaction open while the block runs
+        connection.commit()
+        try:
+            yield bool(acquired)
+        finally:
+            if acquired:
+                connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+                connection.commit()
@@ -5,12 +5,15 @@ This module provides FastAPI-specific dependencies that can be injected
 into route handlers using Depends().
 """
 
-from fastapi import Depends, HTTPException, status
+import secrets
+
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError
 from sqlalchemy.orm import Session
 
 from app.core.auth import decode_access_token, verify_password
+from app.core.config import settings
 from app.core.database import get_db
 from app.repositories.user_repository import UserRepository
 from app.schemas.auth import User
@@ -122,3 +125,28 @@ async def get_current_active_user(
     if current_user.disabled:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
+
+
+async def verify_webhook_token(
+    x_chift_webhook_token: str | None = Header(None),
+) -> None:
+    """
+    FastAPI dependency authenticating Odoo webhook calls with a shared secret.
+
+    Args:
+        x_chift_webhook_token: Value of the X-Chift-Webhook-Token header
+
+    Raises:
+        HTTPException: 503 if no webhook secret is configured, 401 if the
+            token is missing or wrong
+    """
+    if not settings.webhook_secret:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Webhooks are not configured"
+        )
+    if x_chift_webhook_token is None or not secrets.compare_digest(
+        x_chift_webhook_token.encode(), settings.webhook_secret.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid webhook token"
+        )
@@ -0,0 +1,45 @@
+import logging
+import threading
+
+from sqlalchemy import select
+
+from app.core.database import SessionLocal
+from app.models.sync_state import SyncState
+
+logger = logging.getLogger(__name__)
+
+# Set once a sync job has completed in this process
+initial_sync_done = threading.Event()
+
+# Set once the database was found to hold data from earlier syncs
+_warm_database = threading.Event()
+
+
+def _database_is_warm() -> bool:
+    """Whether an earlier sync (from any instance) already filled the database"""
+    if _warm_database.is_set():
+        return True
+
+    db = SessionLocal()
+    try:
+        if db.scalar(select(SyncState.entity).limit(1)) is not None:
+            _warm_database.set()
+    finally:
+        db.close()
+    return _warm_database.is_set()
+
+
+def is_ready() -> bool:
+    """
+    Whether this instance should receive traffic.
+
+    Ready once the first sync has completed, or earlier when the database
+    already holds synced data, so restarts don't wait for Odoo.
+    """
+    if initial_sync_done.is_set():
+        return True
+    try:
+        return _database_is_warm()
+    except Exception as e:
+        logger.warning(f"Readiness check failed: {e}")
+        return False
@@ -1,10 +1,15 @@
+import asyncio
+from datetime import UTC, datetime
 import logging
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from app.core.config import settings
-from app.services.sync_orchestrator import SyncOrchestrator
+from app.core.database import advisory_lock
+from app.core.readiness import initial_sync_done
+from app.services.sync_orchestrator import SYNC_LOCK_KEY, SyncOrchestrator, enqueue_sync_jobs
+from app.services.sync_strategy import sync_stop_event
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -13,22 +18,55 @@ logger = logging.getLogger(__name__)
 
 
 def sync_job():
-    """Job function to sync contacts and invoices from Odoo"""
+    """
+    Job function to sync contacts and invoices from Odoo.
+
+    Every uvicorn worker and replica schedules this job; a PostgreSQL advisory
+    lock lets only one of them sync at a time, the others skip their tick.
+    With ``sync_queue_enabled`` the entities are queued for app.worker instead.
+    """
+    try:
+        if settings.sync_queue_enabled:
+            queued = enqueue_sync_jobs()
+            logger.info(
+                f"Queued sync jobs: {', '.join(queued) or 'none (all still queued or running)'}"
+            )
+            return
+        with advisory_lock(SYNC_LOCK_KEY) as acquired:
+            if not acquired:
+                logger.info("Sync already running in another process, skipping this run")
+                return
+            _run_sync()
+    except Exception as e:
+        logger.error(f"Sync job failed: {e}", exc_info=True)
+
+
+def _run_sync():
+    """Sync all entities and log the results"""
     logger.info("=" * 60)
     logger.info("Starting scheduled sync job...")
 
     sync_orchestrator = None
     try:
         sync_orchestrator = SyncOrchestrator()
-        results = sync_orchestrator.sync_all()
+        if settings.sync_async:
+            results = asyncio.run(sync_orchestrator.async_sync_all())
+        else:
+            results = sync_orchestrator.sync_all()
 
         logger.info("Sync job completed successfully")
+        if results.error_count == 0:
+            initial_sync_done.set()
+
+        if results.skipped_entities:
+            logger.info(f"Skipped (unchanged in Odoo): {', '.join(results.skipped_entities)}")
 
         contacts = results.results.get("contacts")
         if contacts:
             logger.info(
                 f"Contacts - Inserted: {contacts.inserted}, "
                 f"Updated: {contacts.updated}, "
+                f"Unchanged: {contacts.unchanged}, "
                 f"Deleted: {contacts.deleted}, "
                 f"Errors: {contacts.errors}"
             )
@@ -38,6 +76,7 @@ def sync_job():
             logger.info(
                 f"Invoices - Inserted: {invoices.inserted}, "
                 f"Updated: {invoices.updated}, "
+                f"Unchanged: {invoices.unchanged}, "
                 f"Deleted: {invoices.deleted}, "
                 f"Errors: {invoices.errors}"
             )
@@ -55,7 +94,15 @@ class SyncScheduler:
     """Scheduler for periodic Odoo synchronization"""
 
     def __init__(self):
-        self.scheduler = BackgroundScheduler()
+        # One run per process at a time; ticks missed while a slow run is still
+        # going collapse into a single run once it finishes
+        self.scheduler = BackgroundScheduler(
+            job_defaults={
+                "max_instances": 1,
+                "coalesce": True,
+                "misfire_grace_time": settings.sync_interval_minutes * 60,
+            }
+        )
         self.is_running = False
 
     def start(self):
@@ -64,25 +111,25 @@ class SyncScheduler:
             logger.warning("Scheduler is already running")
             return
 
+        sync_stop_event.clear()
         interval_minutes = settings.sync_interval_minutes
         logger.info(f"Starting scheduler with {interval_minutes} minute interval")
 
-        # Schedule the job to run every X minutes
+        # Schedule the job to run every X minutes, and once right away; the
+        # initial run happens on the scheduler's worker thread so startup
+        # doesn't wait for Odoo
         self.scheduler.add_job(
             sync_job,
             trigger=CronTrigger(minute=f"*/{interval_minutes}"),
             id="odoo_sync_job",
             name="Odoo Sync Job",
             replace_existing=True,
+            next_run_time=datetime.now(UTC),
         )
 
         self.scheduler.start()
         self.is_running = True
-        logger.info("Scheduler started successfully")
-
-        # Run the sync immediately on startup
-        logger.info("Running initial sync...")
-        sync_job()
+        logger.info("Scheduler started successfully, initial sync running in the background")
 
     def stop(self):
         """Stop the scheduler"""
@@ -90,6 +137,9 @@ class SyncScheduler:
             logger.warning("Scheduler is not running")
             return
 
+        # Running syncs stop at their next page boundary and checkpoint their
+        # progress; shutdown() then waits for the job to return
+        sync_stop_event.set()
         self.scheduler.shutdown()
         self.is_running = False
         logger.info("Scheduler stopped")
@@ -1,13 +1,16 @@
 from contextlib import asynccontextmanager
 import logging
+import time
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
 from app.core.database import init_db
+from app.core.readiness import is_ready
 from app.core.scheduler import scheduler
-from app.routers import auth, contacts, invoices
+from app.routers import auth, contacts, invoices, webhooks
+from app.services.push_sync import push_sync
 
 # Configure logging
 logging.basicConfig(
@@ -15,6 +18,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Startup only initializes; anything slower belongs on a background thread
+STARTUP_BUDGET_SECONDS = 1.0
+
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
@@ -23,6 +29,7 @@ async def lifespan(_app: FastAPI):
     """
     # Startup
     logger.info("Starting up Chift API...")
+    started = time.perf_counter()
 
     # Initialize database
     try:
@@ -38,10 +45,19 @@ async def lifespan(_app: FastAPI):
     except Exception as e:
         logger.error(f"Scheduler startup failed: {e}")
 
+    _app.state.startup_seconds = time.perf_counter() - started
+    if _app.state.startup_seconds > STARTUP_BUDGET_SECONDS:
+        logger.warning(
+            f"Startup took {_app.state.startup_seconds:.2f}s (budget {STARTUP_BUDGET_SECONDS:.1f}s)"
+        )
+    else:
+        logger.info(f"Startup completed in {_app.state.startup_seconds:.3f}s")
+
     yield
 
     # Shutdown
     logger.info("Shutting down Chift API...")
+    push_sync.stop()
     try:
         scheduler.stop()
         logger.info("Sync scheduler stopped")
@@ -70,6 +86,7 @@ app.add_middleware(
 app.include_router(auth.router, prefix=settings.api_v1_prefix)
 app.include_router(contacts.router, prefix=settings.api_v1_prefix)
 app.include_router(invoices.router, prefix=settings.api_v1_prefix)
+app.include_router(webhooks.router, prefix=settings.api_v1_prefix)
 
 
 @app.get("/")
@@ -83,14 +100,26 @@ async def root():
             "authentication": f"{settings.api_v1_prefix}/auth",
             "contacts": f"{settings.api_v1_prefix}/contacts",
             "invoices": f"{settings.api_v1_prefix}/invoices",
+            "webhooks": f"{settings.api_v1_prefix}/webhooks",
         },
     }
 
 
 @app.get("/health")
-async def health_check():
-    """Health check endpoint"""
+def health_check():
+    """Health check endpoint (liveness, with the readiness state for information)"""
     return {
         "status": "healthy",
+        "ready": is_ready(),
         "scheduler_running": scheduler.is_running,
+        "startup_seconds": getattr(app.state, "startup_seconds", None),
     }
+
+
+@app.get("/ready")
+def readiness_check(response: Response):
+    """Readiness endpoint: 503 until the first sync completed or the database is warm"""
+    ready = is_ready()
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return {"ready": ready}
@@ -16,6 +16,8 @@ class Contact(Base, TimestampMixin):
     city: Mapped[str | None] = mapped_column(String(100), nullable=True)
     country: Mapped[str | None] = mapped_column(String(100), nullable=True)
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    # Hash of the synced fields, used to skip no-op updates
+    fingerprint: Mapped[str | None] = mapped_column(String(32), nullable=True)
 
     def __repr__(self) -> str:
         return f"Contact(id={self.id}, odoo_id={self.odoo_id}, name={self.name!r}, email={self.email!r})"
@@ -20,6 +20,8 @@ class Invoice(Base, TimestampMixin):
     amount_total: Mapped[Decimal] = mapped_column(Numeric(precision=10, scale=2), nullable=False)
     state: Mapped[str] = mapped_column(String(50), nullable=False)  # draft, posted, cancel, etc.
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    # Hash of the synced fields, used to skip no-op updates
+    fingerprint: Mapped[str | None] = mapped_column(String(32), nullable=True)
 
     def __repr__(self) -> str:
         return f"Invoice(id={self.id}, odoo_id={self.odoo_id}, number={self.invoice_number!r}, amount={self.amount_total})"
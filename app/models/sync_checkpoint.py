@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models import Base, TimestampMixin
+
+
+class SyncCheckpoint(Base, TimestampMixin):
+    """Progress of an unfinished full sync, used to resume it instead of starting over"""
+
+    __tablename__ = "sync_checkpoints"
+
+    entity: Mapped[str] = mapped_column(String(50), primary_key=True)
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    # Whether rows are staged for a bulk merge rather than written to the table
+    bulk: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    # Every Odoo record up to this ID has been written (pages arrive in id order)
+    last_odoo_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    records_done: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Watermark saved when the run completes: the latest Odoo write_date before its
+    # first attempt started (with id 0), never one seen in pages fetched since
+    watermark_write_date: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    watermark_odoo_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"SyncCheckpoint(entity={self.entity!r}, last_odoo_id={self.last_odoo_id}, records_done={self.records_done})"
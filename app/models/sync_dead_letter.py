@@ -0,0 +1,19 @@
+from sqlalchemy import Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models import Base, TimestampMixin
+
+
+class SyncDeadLetter(Base, TimestampMixin):
+    """An Odoo record that failed to sync, kept for targeted retries"""
+
+    __tablename__ = "sync_dead_letters"
+
+    entity: Mapped[str] = mapped_column(String(50), primary_key=True)
+    odoo_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    error_class: Mapped[str] = mapped_column(String(100), nullable=False)
+    error_message: Mapped[str] = mapped_column(Text, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"SyncDeadLetter(entity={self.entity!r}, odoo_id={self.odoo_id}, attempts={self.attempts})"
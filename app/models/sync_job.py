@@ -0,0 +1,54 @@
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models import Base, TimestampMixin
+
+# Entity jobs: at most one queued or running per entity (record jobs are not coalesced)
+ACTIVE_ENTITY_JOB = "status IN ('pending', 'running') AND odoo_ids IS NULL"
+
+# Job lifecycle: pending -> running -> done | failed (retryable failures go back to pending)
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+
+class SyncJob(Base, TimestampMixin):
+    """An entity sync queued for the worker processes"""
+
+    __tablename__ = "sync_jobs"
+    __table_args__ = (
+        # At most one queued or running entity job per entity, so enqueueing is idempotent
+        Index(
+            "uq_sync_jobs_active_entity",
+            "entity",
+            unique=True,
+            postgresql_where=text(ACTIVE_ENTITY_JOB),
+        ),
+        Index("ix_sync_jobs_status_run_after", "status", "run_after"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    entity: Mapped[str] = mapped_column(String(50), nullable=False)
+    # Force a full (True) or incremental (False) run; None lets the strategy decide
+    full: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
+    # Only sync these records (webhook notifications) instead of the whole entity
+    odoo_ids: Mapped[list[int] | None] = mapped_column(ARRAY(Integer), nullable=True)
+    status: Mapped[str] = mapped_column(String(20), default=JOB_PENDING, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Not claimed before this time (retry backoff)
+    run_after: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    # Lease of the worker running the job, renewed by its heartbeat
+    worker_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"SyncJob(id={self.id}, entity={self.entity!r}, status={self.status!r}, attempts={self.attempts})"
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models import Base, TimestampMixin
+
+
+class SyncState(Base, TimestampMixin):
+    """Per-entity sync progress (Odoo write_date high-water mark, deletion sweeps)"""
+
+    __tablename__ = "sync_state"
+
+    entity: Mapped[str] = mapped_column(String(50), primary_key=True)
+    last_write_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_odoo_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    last_full_sync_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    last_sync_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_deletion_sweep_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Odoo record count and latest write_date, probed before the last successful run
+    probe_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"SyncState(entity={self.entity!r}, last_write_date={self.last_write_date}, last_odoo_id={self.last_odoo_id})"
@@ -1,6 +1,18 @@
 # Repositories module
 from app.repositories.contact_repository import ContactRepository
 from app.repositories.invoice_repository import InvoiceRepository
+from app.repositories.sync_checkpoint_repository import SyncCheckpointRepository
+from app.repositories.sync_dead_letter_repository import SyncDeadLetterRepository
+from app.repositories.sync_job_repository import SyncJobRepository
+from app.repositories.sync_state_repository import SyncStateRepository
 from app.repositories.user_repository import UserRepository
 
-__all__ = ["ContactRepository", "InvoiceRepository", "UserRepository"]
+__all__ = [
+    "ContactRepository",
+    "InvoiceRepository",
+    "SyncCheckpointRepository",
+    "SyncDeadLetterRepository",
+    "SyncJobRepository",
+    "SyncStateRepository",
+    "UserRepository",
+]
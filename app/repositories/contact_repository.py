@@ -1,14 +1,13 @@
 from sqlalchemy import select
-from sqlalchemy.orm import Session
 
 from app.models.contact import Contact
+from app.repositories.sync_repository import SyncRepository
 
 
-class ContactRepository:
+class ContactRepository(SyncRepository):
     """Repository for Contact database operations"""
 
-    def __init__(self, db: Session):
-        self.db = db
+    model = Contact
 
     def get_all(
         self, skip: int = 0, limit: int = 100, include_deleted: bool = False
@@ -29,28 +28,25 @@ class ContactRepository:
         query = select(Contact).where(Contact.odoo_id == odoo_id)
         return self.db.scalar(query)
 
-    def create(self, contact_data: dict) -> Contact:
-        """Create a new contact"""
+    def create(self, contact_data: dict, commit: bool = True) -> Contact:
+        """Create a new contact (flush only with commit=False)"""
         contact = Contact(**contact_data)
         self.db.add(contact)
-        self.db.commit()
-        self.db.refresh(contact)
+        self._save(contact, commit)
         return contact
 
-    def update(self, contact: Contact, update_data: dict) -> Contact:
-        """Update an existing contact"""
+    def update(self, contact: Contact, update_data: dict, commit: bool = True) -> Contact:
+        """Update an existing contact (flush only with commit=False)"""
         for key, value in update_data.items():
             if hasattr(contact, key):
                 setattr(contact, key, value)
-        self.db.commit()
-        self.db.refresh(contact)
+        self._save(contact, commit)
         return contact
 
-    def soft_delete(self, contact: Contact) -> Contact:
-        """Soft delete a contact (mark as deleted)"""
+    def soft_delete(self, contact: Contact, commit: bool = True) -> Contact:
+        """Soft delete a contact (mark as deleted, flush only with commit=False)"""
         contact.is_deleted = True
-        self.db.commit()
-        self.db.refresh(contact)
+        self._save(contact, commit)
         return contact
 
     def delete(self, contact: Contact) -> None:
@@ -58,9 +54,16 @@ class ContactRepository:
         self.db.delete(contact)
         self.db.commit()
 
+    def get_names_by_odoo_ids(self, odoo_ids: list[int]) -> dict[int, str]:
+        """Map of Odoo ID to name for the given contacts (soft-deleted ones included)"""
+        if not odoo_ids:
+            return {}
+        query = select(Contact.odoo_id, Contact.name).where(Contact.odoo_id.in_(odoo_ids))
+        return dict(self.db.execute(query).tuples().all())
+
     def get_all_odoo_ids(self) -> list[int]:
         """Get all Odoo IDs from contacts in the database"""
-        query = select(Contact.odoo_id).where(not Contact.is_deleted)
+        query = select(Contact.odoo_id).where(Contact.is_deleted.is_(False))
         return list(self.db.scalars(query).all())
 
     def count(self, include_deleted: bool = False) -> int:
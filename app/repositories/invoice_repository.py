@@ -1,14 +1,13 @@
 from sqlalchemy import select
-from sqlalchemy.orm import Session
 
 from app.models.invoice import Invoice
+from app.repositories.sync_repository import SyncRepository
 
 
-class InvoiceRepository:
+class InvoiceRepository(SyncRepository):
     """Repository for Invoice database operations"""
 
-    def __init__(self, db: Session):
-        self.db = db
+    model = Invoice
 
     def get_all(
         self, skip: int = 0, limit: int = 100, include_deleted: bool = False
@@ -29,28 +28,25 @@ class InvoiceRepository:
         query = select(Invoice).where(Invoice.odoo_id == odoo_id)
         return self.db.scalar(query)
 
-    def create(self, invoice_data: dict) -> Invoice:
-        """Create a new invoice"""
+    def create(self, invoice_data: dict, commit: bool = True) -> Invoice:
+        """Create a new invoice (flush only with commit=False)"""
         invoice = Invoice(**invoice_data)
         self.db.add(invoice)
-        self.db.commit()
-        self.db.refresh(invoice)
+        self._save(invoice, commit)
         return invoice
 
-    def update(self, invoice: Invoice, update_data: dict) -> Invoice:
-        """Update an existing invoice"""
+    def update(self, invoice: Invoice, update_data: dict, commit: bool = True) -> Invoice:
+        """Update an existing invoice (flush only with commit=False)"""
         for key, value in update_data.items():
             if hasattr(invoice, key):
                 setattr(invoice, key, value)
-        self.db.commit()
-        self.db.refresh(invoice)
+        self._save(invoice, commit)
         return invoice
 
-    def soft_delete(self, invoice: Invoice) -> Invoice:
-        """Soft delete an invoice (mark as deleted)"""
+    def soft_delete(self, invoice: Invoice, commit: bool = True) -> Invoice:
+        """Soft delete an invoice (mark as deleted, flush only with commit=False)"""
         invoice.is_deleted = True
-        self.db.commit()
-        self.db.refresh(invoice)
+        self._save(invoice, commit)
         return invoice
 
     def delete(self, invoice: Invoice) -> None:
@@ -60,7 +56,7 @@ class InvoiceRepository:
 
     def get_all_odoo_ids(self) -> list[int]:
         """Get all Odoo IDs from invoices in the database"""
-        query = select(Invoice.odoo_id).where(not Invoice.is_deleted)
+        query = select(Invoice.odoo_id).where(Invoice.is_deleted.is_(False))
         return list(self.db.scalars(query).all())
 
     def count(self, include_deleted: bool = False) -> int:
@@ -0,0 +1,66 @@
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from app.models.sync_checkpoint import SyncCheckpoint
+
+
+class SyncCheckpointRepository:
+    """Repository for SyncCheckpoint database operations"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, entity: str) -> SyncCheckpoint | None:
+        """Get the checkpoint of an unfinished full sync for an entity"""
+        return self.db.get(SyncCheckpoint, entity)
+
+    def save(
+        self,
+        entity: str,
+        started_at: datetime,
+        bulk: bool,
+        last_odoo_id: int,
+        records_done: int,
+        watermark: tuple[datetime, int] | None = None,
+        commit: bool = True,
+    ) -> SyncCheckpoint:
+        """
+        Record the progress of a full sync.
+
+        Args:
+            entity: Entity name
+            started_at: When the (first attempt of the) run started
+            bulk: Whether rows are being staged for a bulk merge
+            last_odoo_id: Every Odoo record up to this ID has been written
+            records_done: Records written (or staged) so far
+            watermark: (write_date, id) to save when the run completes, taken
+                before its first attempt started
+            commit: Commit now; pass False to save with the rows of the current
+                transaction, so the checkpoint never runs ahead of the data
+
+        Returns:
+            Updated SyncCheckpoint
+        """
+        checkpoint = self.get(entity)
+        if checkpoint is None:
+            checkpoint = SyncCheckpoint(entity=entity)
+            self.db.add(checkpoint)
+        checkpoint.started_at = started_at
+        checkpoint.bulk = bulk
+        checkpoint.last_odoo_id = last_odoo_id
+        checkpoint.records_done = records_done
+        checkpoint.watermark_write_date, checkpoint.watermark_odoo_id = watermark or (None, None)
+        if commit:
+            self.db.commit()
+        else:
+            self.db.flush()
+        return checkpoint
+
+    def delete(self, entity: str, commit: bool = True) -> None:
+        """Remove the checkpoint once the run has completed (or must start over)"""
+        checkpoint = self.get(entity)
+        if checkpoint is not None:
+            self.db.delete(checkpoint)
+        if commit:
+            self.db.commit()
@@ -0,0 +1,85 @@
+from sqlalchemy import Integer, any_, bindparam, delete, func, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.orm import Session
+
+from app.models.sync_dead_letter import SyncDeadLetter
+
+# Longest error message kept per record
+_MAX_ERROR_MESSAGE_LENGTH = 2000
+
+
+class SyncDeadLetterRepository:
+    """Repository for SyncDeadLetter database operations"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def record(self, entity: str, failures: dict[int, Exception], commit: bool = True) -> None:
+        """
+        Add failed records, or bump the attempt count of ones already dead-lettered.
+
+        Args:
+            entity: Entity name
+            failures: Latest error per Odoo ID
+            commit: Commit after the statement
+        """
+        if not failures:
+            return
+
+        table = SyncDeadLetter.__table__
+        stmt = insert(table).values(
+            [
+                {
+                    "entity": entity,
+                    "odoo_id": odoo_id,
+                    "error_class": type(error).__name__,
+                    "error_message": str(error)[:_MAX_ERROR_MESSAGE_LENGTH],
+                    "attempts": 1,
+                }
+                for odoo_id, error in failures.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.entity, table.c.odoo_id],
+            set_={
+                "error_class": stmt.excluded.error_class,
+                "error_message": stmt.excluded.error_message,
+                "attempts": table.c.attempts + 1,
+                "updated_at": func.now(),
+            },
+        )
+        self.db.execute(stmt)
+        if commit:
+            self.db.commit()
+
+    def get_retryable_ids(self, entity: str, max_attempts: int) -> list[int]:
+        """Odoo IDs of dead-lettered records with attempts left, in ascending order"""
+        query = (
+            select(SyncDeadLetter.odoo_id)
+            .where(SyncDeadLetter.entity == entity, SyncDeadLetter.attempts < max_attempts)
+            .order_by(SyncDeadLetter.odoo_id)
+        )
+        return list(self.db.scalars(query).all())
+
+    def resolve(self, entity: str, odoo_ids: list[int], commit: bool = True) -> None:
+        """Remove records that no longer fail"""
+        if not odoo_ids:
+            return
+        ids = bindparam("odoo_ids", value=odoo_ids, type_=ARRAY(Integer))
+        self.db.execute(
+            delete(SyncDeadLetter).where(
+                SyncDeadLetter.entity == entity, SyncDeadLetter.odoo_id == any_(ids)
+            )
+        )
+        if commit:
+            self.db.commit()
+
+    def resolve_all_except(self, entity: str, odoo_ids: list[int], commit: bool = True) -> None:
+        """Remove every record of an entity except the given (still failing) ones"""
+        stmt = delete(SyncDeadLetter).where(SyncDeadLetter.entity == entity)
+        if odoo_ids:
+            ids = bindparam("odoo_ids", value=odoo_ids, type_=ARRAY(Integer))
+            stmt = stmt.where(~(SyncDeadLetter.odoo_id == any_(ids)))
+        self.db.execute(stmt)
+        if commit:
+            self.db.commit()
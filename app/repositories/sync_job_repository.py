@@ -0,0 +1,173 @@
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.sync_job import (
+    ACTIVE_ENTITY_JOB,
+    JOB_DONE,
+    JOB_FAILED,
+    JOB_PENDING,
+    JOB_RUNNING,
+    SyncJob,
+)
+
+# Longest error message kept per job
+_MAX_ERROR_LENGTH = 2000
+
+
+class SyncJobRepository:
+    """Repository for the SyncJob queue"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enqueue(self, entity: str, full: bool | None = None) -> bool:
+        """
+        Queue a sync of an entity, unless one is already pending or running.
+
+        Returns:
+            Whether a new job was queued
+        """
+        stmt = (
+            insert(SyncJob)
+            .values(entity=entity, full=full, status=JOB_PENDING, attempts=0)
+            .on_conflict_do_nothing(
+                index_elements=[SyncJob.entity],
+                index_where=text(ACTIVE_ENTITY_JOB),
+            )
+        )
+        queued = self.db.execute(stmt).rowcount > 0
+        self.db.commit()
+        return queued
+
+    def enqueue_ids(self, entity: str, odoo_ids: list[int]) -> None:
+        """Queue a sync of specific records of an entity"""
+        self.db.add(SyncJob(entity=entity, odoo_ids=odoo_ids, status=JOB_PENDING, attempts=0))
+        self.db.commit()
+
+    def claim(self, worker_id: str) -> SyncJob | None:
+        """
+        Take the oldest due pending job and lease it to a worker.
+
+        ``FOR UPDATE SKIP LOCKED`` lets concurrent workers claim different jobs
+        without waiting on each other.
+        """
+        now = datetime.now(UTC)
+        query = (
+            select(SyncJob)
+            .where(SyncJob.status == JOB_PENDING, SyncJob.run_after <= now)
+            .order_by(SyncJob.run_after, SyncJob.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        job = self.db.scalar(query)
+        if job is None:
+            self.db.commit()
+            return None
+
+        job.status = JOB_RUNNING
+        job.worker_id = worker_id
+        job.attempts += 1
+        job.started_at = now
+        job.heartbeat_at = now
+        job.error = None
+        self.db.commit()
+        return job
+
+    def heartbeat(self, job_id: int, worker_id: str) -> bool:
+        """
+        Renew a worker's lease on a running job.
+
+        Returns:
+            False if the lease was lost (the job was reaped as stale)
+        """
+        stmt = (
+            update(SyncJob)
+            .where(
+                SyncJob.id == job_id, SyncJob.worker_id == worker_id, SyncJob.status == JOB_RUNNING
+            )
+            .values(heartbeat_at=datetime.now(UTC))
+        )
+        renewed = self.db.execute(stmt).rowcount > 0
+        self.db.commit()
+        return renewed
+
+    def finish(
+        self,
+        job_id: int,
+        worker_id: str,
+        error: str | None = None,
+        retry_after: timedelta | None = None,
+        count_attempt: bool = True,
+    ) -> None:
+        """
+        Release a worker's job.
+
+        Args:
+            job_id: Job ID
+            worker_id: Worker holding the lease; a job reaped meanwhile is left alone
+            error: Failure message, None when the job completed
+            retry_after: Put the job back in the queue, due after this delay,
+                instead of marking it done or failed
+            count_attempt: Whether this claim counts towards the attempt limit
+                (not when the job could not start, e.g. its entity was locked)
+        """
+        values: dict = {"worker_id": None, "heartbeat_at": None}
+        if not count_attempt:
+            values["attempts"] = SyncJob.attempts - 1
+        if error is not None:
+            values["error"] = error[:_MAX_ERROR_LENGTH]
+        if retry_after is not None:
+            values.update(status=JOB_PENDING, run_after=datetime.now(UTC) + retry_after)
+        else:
+            values.update(
+                status=JOB_FAILED if error is not None else JOB_DONE,
+                finished_at=datetime.now(UTC),
+            )
+
+        stmt = (
+            update(SyncJob)
+            .where(
+                SyncJob.id == job_id, SyncJob.worker_id == worker_id, SyncJob.status == JOB_RUNNING
+            )
+            .values(**values)
+        )
+        self.db.execute(stmt)
+        self.db.commit()
+
+    def requeue_stale(self, stale_after: timedelta, max_attempts: int) -> int:
+        """
+        Reap running jobs whose worker stopped sending heartbeats.
+
+        Jobs with attempts left go back to the queue, the others are marked failed.
+
+        Returns:
+            Number of jobs reaped
+        """
+        cutoff = datetime.now(UTC) - stale_after
+        stale = (SyncJob.status == JOB_RUNNING, SyncJob.heartbeat_at < cutoff)
+        released = {"worker_id": None, "heartbeat_at": None, "error": "Worker stopped responding"}
+
+        requeued = self.db.execute(
+            update(SyncJob)
+            .where(*stale, SyncJob.attempts < max_attempts)
+            .values(status=JOB_PENDING, run_after=datetime.now(UTC), **released)
+        ).rowcount
+        failed = self.db.execute(
+            update(SyncJob)
+            .where(*stale, SyncJob.attempts >= max_attempts)
+            .values(status=JOB_FAILED, finished_at=datetime.now(UTC), **released)
+        ).rowcount
+        self.db.commit()
+        return requeued + failed
+
+    def delete_finished(self, before: datetime) -> int:
+        """Remove done and failed jobs that finished before the given time"""
+        stmt = delete(SyncJob).where(
+            SyncJob.status.in_([JOB_DONE, JOB_FAILED]), SyncJob.finished_at < before
+        )
+        deleted = self.db.execute(stmt).rowcount
+        self.db.commit()
+        return deleted
@@ -0,0 +1,256 @@
+from collections.abc import Iterator
+import csv
+import io
+from typing import NamedTuple
+
+from sqlalchemy import Integer, any_, bindparam, func, literal_column, select, text, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.orm import Session
+
+from app.models import Base
+
+# Columns managed by the database rather than the sync
+_SERVER_COLUMNS = frozenset({"id", "created_at", "updated_at"})
+
+# Bulk loads stage rows in "<table>_staging", created at runtime (not a model)
+STAGING_TABLE_SUFFIX = "_staging"
+
+
+class WriteCounts(NamedTuple):
+    """Row counts from a set-based sync write"""
+
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+
+
+class SyncRepository:
+    """
+    Base repository for entities mirrored from Odoo.
+
+    Provides set-based write operations keyed on ``odoo_id`` so the sync can
+    write whole chunks of records in a single statement.
+    """
+
+    model: type[Base]
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _save(self, instance: Base, commit: bool) -> None:
+        """
+        Persist pending changes to an instance.
+
+        With ``commit=False`` changes are only flushed, so the caller owns the
+        transaction (and any savepoint) the write belongs to.
+        """
+        if commit:
+            self.db.commit()
+            self.db.refresh(instance)
+        else:
+            self.db.flush()
+
+    def bulk_upsert(self, rows: list[dict], commit: bool = True) -> WriteCounts:
+        """
+        Insert or update rows in a single ``INSERT ... ON CONFLICT`` statement.
+
+        Existing rows are only rewritten when their fingerprint changed (or they
+        were soft-deleted), so unchanged records cost no write at all.
+
+        Args:
+            rows: Mapped rows, each containing ``odoo_id`` and ``fingerprint`` keys
+            commit: Commit after the statement; pass False to leave the
+                transaction open for the caller
+
+        Returns:
+            WriteCounts with inserted, updated and unchanged counts
+        """
+        if not rows:
+            return WriteCounts()
+
+        # ON CONFLICT cannot touch the same row twice in one statement
+        rows = list({row["odoo_id"]: row for row in rows}.values())
+
+        table = self.model.__table__
+        stmt = insert(table).values(rows)
+        update_columns = {key: stmt.excluded[key] for key in rows[0] if key != "odoo_id"}
+        update_columns["updated_at"] = func.now()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.odoo_id],
+            set_=update_columns,
+            where=table.c.fingerprint.is_distinct_from(stmt.excluded.fingerprint)
+            | table.c.is_deleted,
+        ).returning(literal_column("(xmax = 0)"))
+
+        inserted_flags = self.db.execute(stmt).scalars().all()
+        if commit:
+            self.db.commit()
+
+        inserted = sum(1 for flag in inserted_flags if flag)
+        return WriteCounts(
+            inserted=inserted,
+            updated=len(inserted_flags) - inserted,
+            unchanged=len(rows) - len(inserted_flags),
+        )
+
+    def iter_odoo_ids(self, include_deleted: bool = False) -> Iterator[int]:
+        """Stream Odoo IDs in ascending order without materializing a list"""
+        odoo_id = self.model.__table__.c.odoo_id
+        query = select(odoo_id).order_by(odoo_id).execution_options(yield_per=50_000)
+        if not include_deleted:
+            query = query.where(self.model.__table__.c.is_deleted.is_(False))
+        return iter(self.db.scalars(query))
+
+    def soft_delete_odoo_ids(self, odoo_ids: list[int]) -> list[int]:
+        """
+        Soft-delete rows by Odoo ID in a single statement, then commit.
+
+        Args:
+            odoo_ids: Odoo IDs to mark as deleted
+
+        Returns:
+            Odoo IDs of the rows that were actually soft-deleted
+        """
+        if not odoo_ids:
+            return []
+
+        table = self.model.__table__
+        ids = bindparam("odoo_ids", value=odoo_ids, type_=ARRAY(Integer))
+        stmt = (
+            update(table)
+            .where(table.c.is_deleted.is_(False), table.c.odoo_id == any_(ids))
+            .values(is_deleted=True, updated_at=func.now())
+            .returning(table.c.odoo_id)
+        )
+        deleted_ids = list(self.db.execute(stmt).scalars().all())
+        self.db.commit()
+        return deleted_ids
+
+    @property
+    def sync_columns(self) -> list[str]:
+        """Columns written by the sync, in table order"""
+        return [
+            column.name
+            for column in self.model.__table__.columns
+            if column.name not in _SERVER_COLUMNS
+        ]
+
+    @property
+    def staging_table(self) -> str:
+        """Name of the UNLOGGED staging table used by bulk loads"""
+        return f"{self.model.__tablename__}{STAGING_TABLE_SUFFIX}"
+
+    def is_empty(self) -> bool:
+        """Whether the table has no rows at all (cold start)"""
+        return self.db.scalar(select(self.model.odoo_id).limit(1)) is None
+
+    def begin_bulk_load(self, truncate: bool = True) -> None:
+        """
+        Create (if needed) and truncate the UNLOGGED staging table.
+
+        The staging table copies the column types of the synced columns but
+        no constraints or indexes, so COPY into it is as cheap as possible.
+
+        Args:
+            truncate: Empty the staging table; False keeps the rows staged by
+                an interrupted run that is being resumed
+        """
+        columns = ", ".join(self.sync_columns)
+        table = self.model.__tablename__
+        self.db.execute(
+            text(
+                f"CREATE UNLOGGED TABLE IF NOT EXISTS {self.staging_table} "
+                f"AS SELECT {columns} FROM {table} WITH NO DATA"
+            )
+        )
+        if truncate:
+            self.db.execute(text(f"TRUNCATE {self.staging_table}"))
+
+    def staged_count(self) -> int | None:
+        """
+        Rows in the staging table, or None if it doesn't exist.
+
+        UNLOGGED tables are emptied by Postgres crash recovery, so this is
+        checked before resuming a bulk load.
+        """
+        exists = self.db.scalar(text("SELECT to_regclass(:name)"), {"name": self.staging_table})
+        if exists is None:
+            return None
+        return self.db.scalar(text(f"SELECT count(*) FROM {self.staging_table}"))
+
+    def copy_rows(self, rows: list[dict]) -> None:
+        """Stream mapped rows into the staging table with COPY FROM STDIN"""
+        if not rows:
+            return
+
+        columns = self.sync_columns
+        buffer = io.StringIO()
+        # QUOTE_NOTNULL writes None as an unquoted empty field (NULL in CSV COPY)
+        # while empty strings stay quoted
+        writer = csv.writer(buffer, quoting=csv.QUOTE_NOTNULL, lineterminator="\n")
+        writer.writerows([row.get(column) for column in columns] for row in rows)
+        buffer.seek(0)
+
+        cursor = self.db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {self.staging_table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+        finally:
+            cursor.close()
+
+    def merge_staging(self, soft_delete_missing: bool = True) -> WriteCounts:
+        """
+        Merge the staging table into the main table and soft-delete rows missing from it.
+
+        Runs one set-based upsert and one set-based soft-delete, then commits.
+
+        Args:
+            soft_delete_missing: Soft-delete rows absent from staging (only safe
+                when staging holds every record of the entity)
+
+        Returns:
+            WriteCounts with inserted, updated, unchanged and deleted counts
+        """
+        table = self.model.__tablename__
+        staging = self.staging_table
+        columns = self.sync_columns
+        column_list = ", ".join(columns)
+        updates = ", ".join(
+            f"{column} = excluded.{column}" for column in columns if column != "odoo_id"
+        )
+
+        self.db.execute(text(f"ANALYZE {staging}"))
+        inserted, updated, staged = self.db.execute(
+            text(
+                f"WITH upserted AS ("
+                f" INSERT INTO {table} ({column_list})"
+                f" SELECT DISTINCT ON (odoo_id) {column_list} FROM {staging} ORDER BY odoo_id"
+                f" ON CONFLICT (odoo_id) DO UPDATE SET {updates}, updated_at = now()"
+                f" WHERE {table}.fingerprint IS DISTINCT FROM excluded.fingerprint"
+                f" OR {table}.is_deleted"
+                f" RETURNING (xmax = 0) AS inserted"
+                f") SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted),"
+                f" (SELECT count(DISTINCT odoo_id) FROM {staging})"
+                f" FROM upserted"
+            )
+        ).one()
+        deleted = 0
+        if soft_delete_missing:
+            deleted = self.db.execute(
+                text(
+                    f"UPDATE {table} AS t SET is_deleted = true, updated_at = now()"
+                    f" WHERE NOT t.is_deleted"
+                    f" AND NOT EXISTS (SELECT 1 FROM {staging} AS s WHERE s.odoo_id = t.odoo_id)"
+                )
+            ).rowcount
+        self.db.execute(text(f"TRUNCATE {staging}"))
+        self.db.commit()
+        return WriteCounts(
+            inserted=inserted,
+            updated=updated,
+            unchanged=staged - inserted - updated,
+            deleted=deleted,
+        )
@@ -0,0 +1,66 @@
+from datetime import UTC, datetime
+
+from sqlalchemy.orm import Session
+
+from app.models.sync_state import SyncState
+
+
+class SyncStateRepository:
+    """Repository for SyncState database operations"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, entity: str) -> SyncState | None:
+        """Get sync state for an entity"""
+        return self.db.get(SyncState, entity)
+
+    def get_or_create(self, entity: str) -> SyncState:
+        """Get sync state for an entity, creating an empty one if missing"""
+        state = self.get(entity)
+        if state is None:
+            state = SyncState(entity=entity)
+            self.db.add(state)
+        return state
+
+    def save_watermark(
+        self,
+        entity: str,
+        write_date: datetime | None,
+        odoo_id: int | None,
+        full_sync: bool = False,
+        probe_fingerprint: str | None = None,
+    ) -> SyncState:
+        """
+        Record a completed sync run.
+
+        Args:
+            entity: Entity name
+            write_date: Highest Odoo write_date seen (None keeps the previous value)
+            odoo_id: Highest Odoo ID seen at that write_date
+            full_sync: Whether the run was a full reconciliation
+            probe_fingerprint: Odoo probe taken before the run
+
+        Returns:
+            Updated SyncState
+        """
+        state = self.get_or_create(entity)
+        now = datetime.now(UTC)
+        if write_date is not None:
+            state.last_write_date = write_date
+            state.last_odoo_id = odoo_id
+        state.last_sync_at = now
+        state.probe_fingerprint = probe_fingerprint
+        if full_sync:
+            state.last_full_sync_at = now
+        self.db.commit()
+        self.db.refresh(state)
+        return state
+
+    def mark_deletion_sweep(self, entity: str) -> SyncState:
+        """Record that deletions were reconciled for an entity"""
+        state = self.get_or_create(entity)
+        state.last_deletion_sweep_at = datetime.now(UTC)
+        self.db.commit()
+        self.db.refresh(state)
+        return state
@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.core.deps import verify_webhook_token
+from app.schemas.webhook import WebhookAccepted, WebhookNotification
+from app.services.push_sync import push_sync
+from app.services.sync_orchestrator import SyncOrchestrator
+
+router = APIRouter(prefix="/webhooks", tags=["webhooks"])
+
+
+@router.post(
+    "/odoo",
+    response_model=WebhookAccepted,
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(verify_webhook_token)],
+)
+async def odoo_changes(notification: WebhookNotification):
+    """
+    Accept a batch of Odoo change notifications and sync those records shortly.
+
+    **Authentication required**: Include the shared secret in the X-Chift-Webhook-Token header.
+
+    Notifications are debounced and coalesced, then each entity's records are
+    re-fetched from Odoo by id in batches; records Odoo no longer returns are
+    soft-deleted.
+    """
+    unknown = {change.entity for change in notification.changes} - set(
+        SyncOrchestrator.strategy_classes
+    )
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=f"Unknown entities: {', '.join(sorted(unknown))}",
+        )
+
+    push_sync.add((change.entity, change.odoo_id) for change in notification.changes)
+    return WebhookAccepted(accepted=len(notification.changes))
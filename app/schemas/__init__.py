@@ -8,6 +8,7 @@ from app.schemas.auth import Token, TokenData, User, UserBase, UserCreate, UserI
 from app.schemas.contact import ContactBase, ContactListResponse, ContactResponse
 from app.schemas.invoice import InvoiceBase, InvoiceListResponse, InvoiceResponse
 from app.schemas.sync import EntitySyncResult, SyncResult
+from app.schemas.webhook import WebhookAccepted, WebhookChange, WebhookNotification
 
 __all__ = [
     # Contact schemas
@@ -29,4 +30,8 @@ __all__ = [
     "UserCreate",
     "UserInDB",
     "UserResponse",
+    # Webhook schemas
+    "WebhookAccepted",
+    "WebhookChange",
+    "WebhookNotification",
 ]
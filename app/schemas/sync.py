@@ -1,19 +1,27 @@
 from pydantic import BaseModel, Field
 
+# error_details keeps a sample only; failed records are tracked in sync_dead_letters
+MAX_ERROR_DETAILS = 20
+
 
 class SyncResult(BaseModel):
     """Schema for sync operation results"""
 
     inserted: int = Field(default=0, description="Number of records inserted")
     updated: int = Field(default=0, description="Number of records updated")
+    unchanged: int = Field(default=0, description="Number of records skipped as unchanged")
     deleted: int = Field(default=0, description="Number of records soft-deleted")
     errors: int = Field(default=0, description="Number of errors encountered")
-    error_details: list[str] = Field(default_factory=list, description="Detailed error messages")
+    error_details: list[str] = Field(
+        default_factory=list,
+        description=f"Sample of detailed error messages (first {MAX_ERROR_DETAILS})",
+    )
 
     def add_error(self, error_msg: str):
-        """Add error details"""
+        """Count an error, keeping its details while the sample isn't full"""
         self.errors += 1
-        self.error_details.append(error_msg)
+        if len(self.error_details) < MAX_ERROR_DETAILS:
+            self.error_details.append(error_msg)
 
     @property
     def total_processed(self) -> int:
@@ -27,7 +35,7 @@ class SyncResult(BaseModel):
         return (self.total_processed / total * 100) if total > 0 else 0.0
 
     def __str__(self):
-        return f"SyncResult(inserted={self.inserted}, updated={self.updated}, deleted={self.deleted}, errors={self.errors})"
+        return f"SyncResult(inserted={self.inserted}, updated={self.updated}, unchanged={self.unchanged}, deleted={self.deleted}, errors={self.errors})"
 
 
 class EntitySyncResult(BaseModel):
@@ -36,6 +44,13 @@ class EntitySyncResult(BaseModel):
     entity_name: str = Field(description="Name of the entity that was synced")
     result: SyncResult = Field(description="Sync operation results")
     duration_seconds: float = Field(description="Time taken in seconds")
+    full_sync: bool = Field(default=True, description="Whether this was a full reconciliation")
+    skipped: bool = Field(
+        default=False, description="Whether the run was skipped because nothing changed in Odoo"
+    )
+    interrupted: bool = Field(
+        default=False, description="Whether the run stopped early (full runs resume later)"
+    )
 
     @property
     def was_successful(self) -> bool:
@@ -50,6 +65,9 @@ class FullSyncResult(BaseModel):
     total_duration_seconds: float = Field(description="Total time taken for full sync")
     success_count: int = Field(description="Number of entities successfully synced")
     error_count: int = Field(description="Number of entities with errors")
+    skipped_entities: list[str] = Field(
+        default_factory=list, description="Entities skipped because nothing changed in Odoo"
+    )
 
     @property
     def total_inserted(self) -> int:
@@ -61,6 +79,11 @@ class FullSyncResult(BaseModel):
         """Total records updated across all entities"""
         return sum(result.updated for result in self.results.values())
 
+    @property
+    def total_unchanged(self) -> int:
+        """Total records skipped as unchanged across all entities"""
+        return sum(result.unchanged for result in self.results.values())
+
     @property
     def total_deleted(self) -> int:
         """Total records deleted across all entities"""
@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field
+
+# Largest batch of change notifications accepted in one request
+MAX_WEBHOOK_CHANGES = 10000
+
+
+class WebhookChange(BaseModel):
+    """A record Odoo reports as created, updated or deleted"""
+
+    entity: str = Field(description="Entity name ('contacts' or 'invoices')")
+    odoo_id: int = Field(gt=0, description="Odoo record ID")
+
+
+class WebhookNotification(BaseModel):
+    """Schema for a batch of Odoo change notifications"""
+
+    changes: list[WebhookChange] = Field(min_length=1, max_length=MAX_WEBHOOK_CHANGES)
+
+
+class WebhookAccepted(BaseModel):
+    """Schema for an accepted batch of change notifications"""
+
+    accepted: int = Field(description="Number of notifications queued for sync")
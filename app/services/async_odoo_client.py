@@ -0,0 +1,301 @@
+from array import array
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import itertools
+import logging
+import time
+from typing import Any
+
+import httpx
+
+from app.core.config import settings
+from app.services.odoo_client import (
+    CONTACT_FIELDS,
+    INVOICE_FIELDS,
+    RAW_READ_OPTIONS,
+    RETRYABLE_METHODS,
+    OdooRpcError,
+    build_jsonrpc_request,
+    is_auth_error,
+    is_transient_error,
+    parse_jsonrpc_response,
+)
+from app.services.odoo_governor import OdooGovernor
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncOdooClient:
+    """
+    Asyncio client for the Odoo JSON-RPC API.
+
+    All requests share one pooled httpx.AsyncClient, so many page and entity
+    fetches can overlap on a single event loop. Calls follow an OdooGovernor
+    like OdooClient's: its adaptive limit caps the calls in flight, page reads
+    tune its page size, and transient faults back it off and are retried.
+    Pass the sync client's governor to share one load budget with it.
+    """
+
+    def __init__(
+        self,
+        url: str | None = None,
+        db: str | None = None,
+        username: str | None = None,
+        password: str | None = None,
+        uid: int | None = None,
+        governor: OdooGovernor | None = None,
+    ):
+        self.url = url or settings.odoo_url
+        self.db = db or settings.odoo_db
+        self.username = username or settings.odoo_username
+        self.password = password or settings.odoo_password
+        self.uid: int | None = uid
+        self.client = httpx.AsyncClient(
+            base_url=self.url,
+            timeout=httpx.Timeout(settings.odoo_call_timeout_seconds, connect=10.0),
+            headers={"Content-Type": "application/json"},
+        )
+        self.governor = governor or OdooGovernor()
+        self._in_flight = 0
+        self._slot_freed = asyncio.Condition()
+        self._auth_lock = asyncio.Lock()
+        self._request_ids = itertools.count(1)
+        self._country_names: dict[int, str] | None = None
+
+    @asynccontextmanager
+    async def _slot(self) -> AsyncIterator[None]:
+        """Hold a call slot, waiting while the governor's concurrency limit is reached"""
+        async with self._slot_freed:
+            await self._slot_freed.wait_for(lambda: self._in_flight < self.governor.concurrency)
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            async with self._slot_freed:
+                self._in_flight -= 1
+                self._slot_freed.notify_all()
+
+    async def _call(self, service: str, method: str, *args: Any) -> Any:
+        """Call a service method and return its result"""
+        payload = build_jsonrpc_request(service, method, args, next(self._request_ids))
+        response = await self.client.post("/jsonrpc", content=payload)
+        response.raise_for_status()
+        return parse_jsonrpc_response(response.content)
+
+    async def authenticate(self) -> int:
+        """
+        Authenticate with Odoo and return user ID.
+        Raises exception if authentication fails.
+        """
+        stale_uid = self.uid
+        async with self._auth_lock:
+            if self.uid and self.uid != stale_uid:
+                # Another task re-authenticated while we waited
+                return self.uid
+            try:
+                uid = await self._call(
+                    "common", "authenticate", self.db, self.username, self.password, {}
+                )
+                if not uid:
+                    raise Exception("Authentication failed: Invalid credentials")
+                self.uid = uid
+                logger.info(f"Successfully authenticated with Odoo. User ID: {self.uid}")
+                return self.uid
+            except Exception as e:
+                logger.error(f"Odoo authentication error: {e}")
+                raise
+
+    async def _execute_kw(
+        self,
+        model: str,
+        method: str,
+        args: list,
+        kwargs: dict | None = None,
+        *,
+        paged: bool = False,
+    ) -> Any:
+        """
+        Execute a method on an Odoo model.
+        Automatically authenticates if not already authenticated, and
+        re-authenticates once if the cached credentials are rejected.
+
+        Read-only calls are retried with jittered exponential backoff on
+        transient faults, up to ``odoo_max_retries`` times (see OdooClient).
+
+        Args:
+            paged: The call reads one page; its latency tunes the page size
+        """
+        if kwargs is None:
+            kwargs = {}
+        max_retries = settings.odoo_max_retries if method in RETRYABLE_METHODS else 0
+
+        attempt = 0
+        while True:
+            try:
+                async with self._slot():
+                    started = time.monotonic()
+                    result = await self._execute_kw_once(model, method, args, kwargs)
+                self.governor.on_success(time.monotonic() - started, paged=paged)
+                return result
+            except Exception as e:
+                if attempt >= max_retries or not is_transient_error(e):
+                    logger.error(f"Error executing {method} on {model}: {e}")
+                    raise
+                self.governor.on_failure(f"{type(e).__name__} on {model}.{method}")
+                delay = self.governor.backoff(attempt)
+                attempt += 1
+                logger.warning(
+                    f"Transient error executing {method} on {model} ({e}), "
+                    f"retry {attempt}/{max_retries} in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+    async def _execute_kw_once(self, model: str, method: str, args: list, kwargs: dict) -> Any:
+        """Single execute_kw call, re-authenticating once if credentials are rejected"""
+        uid = self.uid or await self.authenticate()
+        try:
+            return await self._call(
+                "object", "execute_kw", self.db, uid, self.password, model, method, args, kwargs
+            )
+        except OdooRpcError as e:
+            if not is_auth_error(e):
+                raise
+            logger.warning(f"Odoo rejected cached credentials ({e}), re-authenticating")
+            uid = await self.authenticate()
+            return await self._call(
+                "object", "execute_kw", self.db, uid, self.password, model, method, args, kwargs
+            )
+
+    async def iter_search_read(
+        self, model: str, domain: list, fields: list[str], page_size: int | None = None
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Fetch search_read results as concurrent id-range pages.
+
+        Mirrors OdooClient.iter_search_read_parallel: one id-only search, then
+        one search_read per range of ``page_size`` ids (sized by the governor as
+        ranges are scheduled, unless fixed). Up to twice the governor's maximum
+        concurrency of pages are scheduled ahead of the consumer, and pages are
+        yielded in range order.
+
+        Yields:
+            Lists of record dictionaries, in ascending id order
+        """
+        window = self.governor.max_concurrency * 2
+
+        ids = array("q", await self._execute_kw(model, "search", [domain], {"order": "id asc"}))
+        next_index = 0
+
+        def next_range() -> tuple[int, int] | None:
+            nonlocal next_index
+            if next_index >= len(ids):
+                return None
+            end = min(next_index + (page_size or self.governor.page_size), len(ids))
+            id_range = (ids[next_index], ids[end - 1])
+            next_index = end
+            return id_range
+
+        async def fetch_range(first_id: int, last_id: int) -> list[dict[str, Any]]:
+            range_domain = [*domain, ["id", ">=", first_id], ["id", "<=", last_id]]
+            return await self._execute_kw(
+                model,
+                "search_read",
+                [range_domain],
+                {"fields": fields, "order": "id asc", **RAW_READ_OPTIONS},
+                paged=True,
+            )
+
+        pending: deque[asyncio.Task] = deque()
+
+        def schedule_next() -> None:
+            id_range = next_range()
+            if id_range is not None:
+                pending.append(asyncio.create_task(fetch_range(*id_range)))
+
+        total = 0
+        try:
+            for _ in range(window):
+                schedule_next()
+
+            while pending:
+                page = await pending.popleft()
+                schedule_next()
+                total += len(page)
+                yield page
+        finally:
+            for task in pending:
+                task.cancel()
+
+        logger.info(f"Fetched {total} {model} records from Odoo")
+
+    def iter_contacts(
+        self, domain: list | None = None, page_size: int | None = None
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Stream contacts (partners) from Odoo page by page"""
+        return self.iter_search_read("res.partner", domain or [], CONTACT_FIELDS, page_size)
+
+    def iter_invoices(
+        self, domain: list | None = None, page_size: int | None = None
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Stream invoices from Odoo page by page"""
+        return self.iter_search_read("account.move", domain or [], INVOICE_FIELDS, page_size)
+
+    async def probe(self, model: str, domain: list) -> str:
+        """Cheap change marker for the records matching a domain (see OdooClient.probe)"""
+        count, latest = await asyncio.gather(
+            self._execute_kw(model, "search_count", [domain]),
+            self._execute_kw(
+                model,
+                "search_read",
+                [domain],
+                {"fields": ["write_date"], "order": "write_date desc", "limit": 1},
+            ),
+        )
+        write_date = latest[0]["write_date"] if latest else ""
+        return f"{count}:{write_date}"
+
+    async def get_country_names(self, refresh: bool = False) -> dict[int, str]:
+        """
+        Map of country ID to name, fetched once and cached on the client.
+
+        Args:
+            refresh: Re-fetch the countries (e.g. after seeing an unknown ID)
+        """
+        if self._country_names is None or refresh:
+            countries = await self._execute_kw(
+                "res.country", "search_read", [[]], {"fields": ["name"]}
+            )
+            self._country_names = {country["id"]: country["name"] for country in countries}
+            logger.debug(f"Cached {len(self._country_names)} Odoo countries")
+        return self._country_names
+
+    async def get_partner_names(self, partner_ids: list[int]) -> dict[int, str]:
+        """
+        Map of partner ID to name for the given partners, archived ones included.
+
+        Args:
+            partner_ids: Odoo partner IDs
+        """
+        if not partner_ids:
+            return {}
+        partners = await self._execute_kw(
+            "res.partner",
+            "search_read",
+            [[["id", "in", partner_ids]]],
+            {"fields": ["name"], "context": {"active_test": False}},
+        )
+        return {partner["id"]: partner["name"] for partner in partners}
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connections"""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.aclose()
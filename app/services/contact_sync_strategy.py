@@ -1,41 +1,71 @@
-from typing import Any
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
 
 from app.repositories.contact_repository import ContactRepository
+from app.services.field_mapper import Field, FieldMapper, falsy_to_none, many2one_id, text_or_empty
+from app.services.odoo_client import CONTACT_FIELDS
 from app.services.sync_strategy import SyncStrategy
 
+if TYPE_CHECKING:
+    from app.services.async_odoo_client import AsyncOdooClient
+
 
 class ContactSyncStrategy(SyncStrategy):
     """Strategy for syncing contacts from Odoo"""
 
-    def fetch_odoo_data(self) -> list[dict[str, Any]]:
+    odoo_model = "res.partner"
+    odoo_fields = CONTACT_FIELDS
+    mapper = FieldMapper(
+        "contact",
+        [
+            Field("odoo_id", "id", required=True),
+            Field("name", convert=text_or_empty),
+            Field("email", convert=falsy_to_none),
+            Field("phone", convert=falsy_to_none),
+            Field("street", convert=falsy_to_none),
+            Field("city", convert=falsy_to_none),
+        ],
+        constants={"is_deleted": False},
+    )
+    # Country lookup of the current page when fetched through the async client
+    _prefetched_countries: dict[int, str] | None = None
+
+    def fetch_odoo_pages(self, domain: list) -> Iterator[list[dict[str, Any]]]:
         """Fetch contacts from Odoo"""
-        return self.odoo_client.fetch_contacts()
+        return self.odoo_client.iter_contacts(domain=domain)
+
+    def fetch_odoo_ids(self, domain: list) -> list[int]:
+        """Fetch contact IDs from Odoo"""
+        return self.odoo_client.get_all_contact_ids(domain=domain)
 
     def get_repository(self):
         """Get contact repository"""
         return ContactRepository(self.db)
 
-    def map_odoo_to_db(self, odoo_contact: dict[str, Any]) -> dict[str, Any]:
-        """Map Odoo contact data to database schema"""
-        country_name = None
-        if odoo_contact.get("country_id"):
-            # country_id is a tuple (id, name) or False
-            country_name = (
-                odoo_contact["country_id"][1]
-                if isinstance(odoo_contact["country_id"], (list, tuple))
-                else None
-            )
-
-        return {
-            "odoo_id": odoo_contact["id"],
-            "name": odoo_contact.get("name", ""),
-            "email": odoo_contact.get("email") or None,
-            "phone": odoo_contact.get("phone") or None,
-            "street": odoo_contact.get("street") or None,
-            "city": odoo_contact.get("city") or None,
-            "country": country_name,
-            "is_deleted": False,
-        }
+    def map_page(self, odoo_items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Map a page of contacts, resolving country names from the cached country lookup"""
+        rows = super().map_page(odoo_items)
+        country_ids = [many2one_id(item.get("country_id")) for item in odoo_items]
+
+        countries = self._prefetched_countries
+        if countries is None:
+            countries = self.odoo_client.get_country_names()
+            if not countries.keys() >= set(country_ids) - {None}:
+                countries = self.odoo_client.get_country_names(refresh=True)
+
+        for row, country_id in zip(rows, country_ids, strict=True):
+            row["country"] = countries.get(country_id)
+        return rows
+
+    async def prefetch_lookups(
+        self, odoo_client: "AsyncOdooClient", odoo_items: list[dict[str, Any]]
+    ) -> None:
+        """Resolve the page's countries through the async client's country lookup"""
+        country_ids = {many2one_id(item.get("country_id")) for item in odoo_items} - {None}
+        countries = await odoo_client.get_country_names()
+        if not countries.keys() >= country_ids:
+            countries = await odoo_client.get_country_names(refresh=True)
+        self._prefetched_countries = countries
 
     def get_entity_name(self) -> str:
         """Get entity name for logging"""
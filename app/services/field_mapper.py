@@ -0,0 +1,139 @@
+"""
+Declarative mapping of Odoo records to database rows.
+
+Strategies describe their columns as a list of Field specs. FieldMapper
+turns each spec into a getter once, so a page of records is mapped with one
+comprehension over the getters instead of per-field branches and log calls.
+"""
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import date
+import logging
+import operator
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Number of example ids included in aggregated log messages
+_LOG_SAMPLE_SIZE = 5
+
+Converter = Callable[[Any], Any]
+Getter = Callable[[dict[str, Any]], Any]
+
+
+def falsy_to_none(value: Any) -> Any:
+    """Odoo returns False (or "") for empty fields"""
+    return value or None
+
+
+def text_or_empty(value: Any) -> str:
+    """Required text column: empty Odoo values become an empty string"""
+    return value or ""
+
+
+def many2one_id(value: Any) -> int | None:
+    """
+    ID of a many2one value: a bare id when read with load=None, otherwise
+    (id, name); False when empty.
+    """
+    if not value:
+        return None
+    return value if isinstance(value, int) else value[0]
+
+
+def odoo_date(value: Any) -> date | None:
+    """Odoo date string (YYYY-MM-DD), or None for empty dates"""
+    return date.fromisoformat(value) if value else None
+
+
+@dataclass(frozen=True)
+class Field:
+    """How one database column is filled from an Odoo record"""
+
+    column: str
+    # Odoo field name (defaults to the column name)
+    source: str | None = None
+    # Applied to the Odoo value
+    convert: Converter | None = None
+    # Used when the Odoo field is absent from the record
+    default: Any = None
+    # Raise KeyError instead of using the default when the field is absent
+    required: bool = False
+    # Computed from the whole record instead of a single field
+    compute: Callable[[dict[str, Any]], Any] | None = None
+    # Log level for an aggregated per-batch report of records where the field is empty
+    log_missing: int | None = None
+
+    @property
+    def odoo_field(self) -> str:
+        """Odoo field this column is read from"""
+        return self.source or self.column
+
+    def getter(self) -> Getter:
+        """Function reading this column's value from an Odoo record"""
+        if self.compute is not None:
+            return self.compute
+
+        odoo_field, default, convert = self.odoo_field, self.default, self.convert
+        if self.required:
+            read = operator.itemgetter(odoo_field)
+        else:
+
+            def read(record: dict[str, Any]) -> Any:
+                return record.get(odoo_field, default)
+
+        if convert is None:
+            return read
+        return lambda record: convert(read(record))
+
+
+class FieldMapper:
+    """
+    Mapper from Odoo records to database rows, built once per strategy.
+
+    Example:
+        mapper = FieldMapper("contact", [
+            Field("odoo_id", "id", required=True),
+            Field("email", convert=falsy_to_none),
+        ], constants={"is_deleted": False})
+        rows = mapper.map_batch(records)
+    """
+
+    def __init__(
+        self, entity_name: str, fields: Iterable[Field], constants: dict[str, Any] | None = None
+    ):
+        self.entity_name = entity_name
+        self.fields = tuple(fields)
+        self.constants = dict(constants or {})
+        self._missing_reports = [
+            (spec.odoo_field, spec.log_missing)
+            for spec in self.fields
+            if spec.log_missing is not None
+        ]
+        self._getters = tuple((spec.column, spec.getter()) for spec in self.fields)
+
+    def map_batch(self, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Map a page of Odoo records to database rows"""
+        getters, constants = self._getters, self.constants
+        rows = [{column: get(record) for column, get in getters} | constants for record in records]
+        if self._missing_reports:
+            self._report_missing(records)
+        return rows
+
+    def _report_missing(self, records: list[dict[str, Any]]) -> None:
+        """Log one line per field that is empty in some records of the batch"""
+        for odoo_field, level in self._missing_reports:
+            if not logger.isEnabledFor(level):
+                continue
+            missing = [record.get("id") for record in records if not record.get(odoo_field)]
+            if missing:
+                logger.log(
+                    level,
+                    "%d of %d %s records have no %s (e.g. ids %s)",
+                    len(missing),
+                    len(records),
+                    self.entity_name,
+                    odoo_field,
+                    ", ".join(map(str, missing[:_LOG_SAMPLE_SIZE])),
+                )
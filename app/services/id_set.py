@@ -0,0 +1,107 @@
+"""
+Compact integer id sets for million-row reconciliation.
+
+A Python ``set[int]`` costs roughly 60-70 bytes per id (boxed int plus hash
+table slot). IdSet keeps ids in a sorted, de-duplicated ``array('q')`` at
+8 bytes per id and computes differences with a linear merge, or with NumPy
+when it is installed.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from operator import lt
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is an optional speedup
+    np = None
+
+
+def _is_strictly_sorted(ids: array) -> bool:
+    """Whether ids are in ascending order without duplicates"""
+    return all(map(lt, ids, islice(ids, 1, None)))
+
+
+class IdSet:
+    """Immutable sorted set of int64 ids backed by ``array('q')``"""
+
+    __slots__ = ("_ids",)
+
+    def __init__(self, ids: Iterable[int] = ()):
+        """
+        Build a set from any iterable of ids.
+
+        Already sorted input (e.g. ``ORDER BY id`` results) is stored as-is in
+        a single pass; anything else is sorted and de-duplicated.
+        """
+        if isinstance(ids, IdSet):
+            self._ids = ids._ids
+            return
+
+        values = array("q", ids)
+        if not _is_strictly_sorted(values):
+            if np is not None:
+                values = array("q", np.unique(np.frombuffer(values, dtype=np.int64)).tobytes())
+            else:
+                values = array("q", sorted(set(values)))
+        self._ids = values
+
+    @classmethod
+    def _from_array(cls, values: array) -> "IdSet":
+        """Wrap an array already known to be sorted and unique"""
+        id_set = cls.__new__(cls)
+        id_set._ids = values
+        return id_set
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+    def __contains__(self, odoo_id: object) -> bool:
+        if not isinstance(odoo_id, int):
+            return False
+        index = bisect_left(self._ids, odoo_id)
+        return index < len(self._ids) and self._ids[index] == odoo_id
+
+    def __sub__(self, other: "IdSet") -> "IdSet":
+        return self.difference(other)
+
+    def __repr__(self) -> str:
+        return f"IdSet(len={len(self)})"
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the id buffer"""
+        return self._ids.itemsize * len(self._ids)
+
+    def difference(self, other: "IdSet") -> "IdSet":
+        """Ids in this set but not in other"""
+        if not self._ids or not other._ids:
+            return IdSet._from_array(array("q", self._ids))
+
+        if np is not None:
+            result = np.setdiff1d(
+                np.frombuffer(self._ids, dtype=np.int64),
+                np.frombuffer(other._ids, dtype=np.int64),
+                assume_unique=True,
+            )
+            return IdSet._from_array(array("q", result.tobytes()))
+
+        # Merge walk over both sorted arrays
+        left, right = self._ids, other._ids
+        result = array("q")
+        j, right_len = 0, len(right)
+        for value in left:
+            while j < right_len and right[j] < value:
+                j += 1
+            if j == right_len or right[j] != value:
+                result.append(value)
+        return IdSet._from_array(result)
+
+    def tolist(self) -> list[int]:
+        """Ids as a plain list (e.g. for a database array parameter)"""
+        return self._ids.tolist()
@@ -1,64 +1,94 @@
-from typing import Any
+import asyncio
+from collections.abc import Iterator
+import logging
+from typing import TYPE_CHECKING, Any
 
+from app.repositories.contact_repository import ContactRepository
 from app.repositories.invoice_repository import InvoiceRepository
+from app.services.field_mapper import Field, FieldMapper, many2one_id, odoo_date
+from app.services.odoo_client import INVOICE_FIELDS
 from app.services.sync_strategy import SyncStrategy
 
+if TYPE_CHECKING:
+    from app.services.async_odoo_client import AsyncOdooClient
+
 
 class InvoiceSyncStrategy(SyncStrategy):
     """Strategy for syncing invoices from Odoo"""
 
-    def fetch_odoo_data(self) -> list[dict[str, Any]]:
-        """Fetch invoices from Odoo (customer invoices only)"""
-        domain = [["move_type", "=", "out_invoice"]]
-        return self.odoo_client.fetch_invoices(domain=domain)
+    odoo_model = "account.move"
+    odoo_fields = INVOICE_FIELDS
+    mapper = FieldMapper(
+        "invoice",
+        [
+            Field("odoo_id", "id", required=True),
+            # Draft invoices often don't have numbers yet
+            Field(
+                "invoice_number",
+                "name",
+                compute=lambda invoice: invoice.get("name") or f"DRAFT-{invoice['id']}",
+                log_missing=logging.WARNING,
+            ),
+            Field("partner_id", convert=many2one_id),
+            Field("invoice_date", convert=odoo_date, log_missing=logging.DEBUG),
+            Field("due_date", "invoice_date_due", convert=odoo_date, log_missing=logging.DEBUG),
+            Field("amount_total", default=0),
+            Field("state", default="draft"),
+        ],
+        constants={"is_deleted": False},
+    )
+    # Partner names of the current page when fetched through the async client
+    _prefetched_partner_names: dict[int, str] | None = None
+
+    def get_domain(self) -> list:
+        """Customer invoices only"""
+        return [["move_type", "=", "out_invoice"]]
+
+    def fetch_odoo_pages(self, domain: list) -> Iterator[list[dict[str, Any]]]:
+        """Fetch invoices from Odoo"""
+        return self.odoo_client.iter_invoices(domain=domain)
+
+    def fetch_odoo_ids(self, domain: list) -> list[int]:
+        """Fetch invoice IDs from Odoo"""
+        return self.odoo_client.get_all_invoice_ids(domain=domain)
 
     def get_repository(self):
         """Get invoice repository"""
         return InvoiceRepository(self.db)
 
-    def map_odoo_to_db(self, odoo_invoice: dict[str, Any]) -> dict[str, Any]:
-        """Map Odoo invoice data to database schema"""
-        partner_id = None
-        partner_name = None
-        if odoo_invoice.get("partner_id"):
-            # partner_id is a tuple (id, name) or False
-            if isinstance(odoo_invoice["partner_id"], (list, tuple)):
-                partner_id = odoo_invoice["partner_id"][0]
-                partner_name = odoo_invoice["partner_id"][1]
-
-        # Odoo returns False for empty fields - draft invoices often don't have numbers yet
-        invoice_number = odoo_invoice.get("name")
-        if not invoice_number or invoice_number is False:
-            invoice_number = f"DRAFT-{odoo_invoice['id']}"
-            self.logger.warning(
-                f"Invoice {odoo_invoice['id']} has no invoice number, using placeholder: {invoice_number}"
-            )
-
-        invoice_date = odoo_invoice.get("invoice_date")
-        if invoice_date is False:
-            invoice_date = None
-            self.logger.debug(
-                f"Invoice {odoo_invoice['id']} has no invoice_date (likely draft state)"
-            )
+    def map_page(self, odoo_items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Map a page of invoices, filling partner names from the synced contacts"""
+        rows = super().map_page(odoo_items)
+        partner_names = self._partner_names({row["partner_id"] for row in rows} - {None})
+        for row in rows:
+            row["partner_name"] = partner_names.get(row["partner_id"])
+        return rows
 
-        due_date = odoo_invoice.get("invoice_date_due")
-        if due_date is False:
-            due_date = None
-            self.logger.debug(
-                f"Invoice {odoo_invoice['id']} has no due_date"
-            )
+    def _partner_names(self, partner_ids: set[int]) -> dict[int, str]:
+        """Partner names from the local contacts table, falling back to Odoo for unsynced ones"""
+        if not partner_ids:
+            return {}
+        prefetched = self._prefetched_partner_names
+        if prefetched is not None and prefetched.keys() >= partner_ids:
+            return prefetched
+        names = ContactRepository(self.db).get_names_by_odoo_ids(list(partner_ids))
+        missing = partner_ids - names.keys()
+        if missing:
+            names.update(self.odoo_client.get_partner_names(sorted(missing)))
+        return names
 
-        return {
-            "odoo_id": odoo_invoice["id"],
-            "invoice_number": invoice_number,
-            "partner_id": partner_id,
-            "partner_name": partner_name,
-            "invoice_date": invoice_date,
-            "due_date": due_date,
-            "amount_total": odoo_invoice.get("amount_total", 0),
-            "state": odoo_invoice.get("state", "draft"),
-            "is_deleted": False,
-        }
+    async def prefetch_lookups(
+        self, odoo_client: "AsyncOdooClient", odoo_items: list[dict[str, Any]]
+    ) -> None:
+        """Resolve the page's unsynced partners through the async client"""
+        partner_ids = {many2one_id(item.get("partner_id")) for item in odoo_items} - {None}
+        names = await asyncio.to_thread(
+            ContactRepository(self.db).get_names_by_odoo_ids, list(partner_ids)
+        )
+        missing = partner_ids - names.keys()
+        if missing:
+            names.update(await odoo_client.get_partner_names(sorted(missing)))
+        self._prefetched_partner_names = names
 
     def get_entity_name(self) -> str:
         """Get entity name for logging"""
@@ -1,57 +1,547 @@
+from abc import ABC, abstractmethod
+from array import array
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime
+import http.client
+import itertools
 import logging
+import threading
+import time
 from typing import Any
 import xmlrpc.client
 
+import httpx
+import orjson
+
 from app.core.config import settings
+from app.services.odoo_governor import OdooGovernor
 
 logger = logging.getLogger(__name__)
 
+# Format Odoo uses for datetime values over RPC (always UTC)
+ODOO_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+CONTACT_FIELDS = [
+    "id",
+    "name",
+    "email",
+    "phone",
+    "street",
+    "city",
+    "country_id",
+    "write_date",
+]
+
+INVOICE_FIELDS = [
+    "id",
+    "name",  # invoice number
+    "partner_id",
+    "invoice_date",
+    "invoice_date_due",
+    "amount_total",
+    "state",
+    "write_date",
+]
+
+# Read-only methods that are safe to retry after a transient fault
+RETRYABLE_METHODS = frozenset({"search", "search_read", "search_count", "read", "read_group"})
+
+# HTTP statuses returned by proxies in front of an overloaded Odoo
+_TRANSIENT_HTTP_STATUSES = frozenset({429, 502, 503, 504})
+
+# Odoo faults caused by concurrent database activity rather than the request itself
+_TRANSIENT_FAULT_MARKERS = (
+    "could not serialize access",
+    "concurrent update",
+    "deadlock detected",
+    "SerializationFailure",
+)
+
+# search_read options for sync fetches: load=None returns many2one fields as bare
+# ids, skipping Odoo's per-record display name resolution (names are resolved locally)
+RAW_READ_OPTIONS = {"load": None}
+
+
+def parse_odoo_datetime(value: str) -> datetime:
+    """Parse an Odoo RPC datetime string into an aware UTC datetime"""
+    return datetime.strptime(value, ODOO_DATETIME_FORMAT).replace(tzinfo=UTC)
+
+
+def probe_write_date(probe: str) -> str | None:
+    """Latest write_date recorded in a probe() change marker (None without records)"""
+    return probe.partition(":")[2] or None
+
+
+class OdooRpcError(Exception):
+    """Error returned by the Odoo server over JSON-RPC"""
+
+    def __init__(self, message: str, name: str | None = None):
+        super().__init__(message)
+        self.name = name
+
+
+def build_jsonrpc_request(service: str, method: str, args: tuple | list, request_id: int) -> bytes:
+    """Encode a JSON-RPC 2.0 call to an Odoo service"""
+    payload = {
+        "jsonrpc": "2.0",
+        "method": "call",
+        "params": {"service": service, "method": method, "args": args},
+        "id": request_id,
+    }
+    return orjson.dumps(payload)
+
+
+def parse_jsonrpc_response(content: bytes) -> Any:
+    """Decode a JSON-RPC response body, raising OdooRpcError on server errors"""
+    body = orjson.loads(content)
+    error = body.get("error")
+    if error:
+        data = error.get("data") or {}
+        message = data.get("message") or error.get("message", "Unknown Odoo error")
+        raise OdooRpcError(message, name=data.get("name"))
+    return body["result"]
+
+
+class OdooTransport(ABC):
+    """RPC transport used by OdooClient to reach the Odoo external API"""
+
+    def __init__(self, url: str, timeout: float | None = None):
+        self.url = url
+        # Deadline for a single call (connect + response)
+        self.timeout = timeout or settings.odoo_call_timeout_seconds
+
+    @abstractmethod
+    def authenticate(self, db: str, username: str, password: str) -> int | bool:
+        """Call common.authenticate, returning the user ID or False"""
+
+    @abstractmethod
+    def execute_kw(
+        self, db: str, uid: int, password: str, model: str, method: str, args: list, kwargs: dict
+    ) -> Any:
+        """Call object.execute_kw"""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release any connections held by the transport"""
+
+
+class _TimeoutMixin:
+    """Apply a socket timeout to connections made by an xmlrpc.client transport"""
+
+    timeout: float | None = None
+
+    def make_connection(self, host):
+        connection = super().make_connection(host)
+        connection.timeout = self.timeout
+        return connection
+
+
+class _TimeoutTransport(_TimeoutMixin, xmlrpc.client.Transport):
+    pass
+
+
+class _SafeTimeoutTransport(_TimeoutMixin, xmlrpc.client.SafeTransport):
+    pass
+
+
+class XmlRpcTransport(OdooTransport):
+    """Transport over Odoo's XML-RPC endpoints (/xmlrpc/2/*)"""
+
+    def __init__(self, url: str, timeout: float | None = None):
+        super().__init__(url, timeout)
+        # ServerProxy is not thread-safe, so each thread gets its own
+        self._local = threading.local()
+
+    def _proxy(self, endpoint: str) -> xmlrpc.client.ServerProxy:
+        """Proxy for an endpoint ('common' or 'object') for the calling thread"""
+        proxy = getattr(self._local, endpoint, None)
+        if proxy is None:
+            transport_class = (
+                _SafeTimeoutTransport if self.url.startswith("https") else _TimeoutTransport
+            )
+            transport = transport_class()
+            transport.timeout = self.timeout
+            # allow_none is needed to send load=None (see RAW_READ_OPTIONS)
+            proxy = xmlrpc.client.ServerProxy(
+                f"{self.url}/xmlrpc/2/{endpoint}", transport=transport, allow_none=True
+            )
+            setattr(self._local, endpoint, proxy)
+        return proxy
+
+    def authenticate(self, db: str, username: str, password: str) -> int | bool:
+        return self._proxy("common").authenticate(db, username, password, {})
+
+    def execute_kw(
+        self, db: str, uid: int, password: str, model: str, method: str, args: list, kwargs: dict
+    ) -> Any:
+        return self._proxy("object").execute_kw(db, uid, password, model, method, args, kwargs)
+
+    def close(self) -> None:
+        # Drop cached proxies; their connections close once garbage collected
+        self._local = threading.local()
+
+
+class JsonRpcTransport(OdooTransport):
+    """
+    Transport over Odoo's /jsonrpc endpoint.
+
+    Uses a pooled keep-alive httpx client, which is thread-safe and much
+    cheaper to decode than XML-RPC for large result sets.
+    """
+
+    def __init__(self, url: str, timeout: float | None = None):
+        super().__init__(url, timeout)
+        self.client = httpx.Client(
+            base_url=url,
+            timeout=httpx.Timeout(self.timeout, connect=10.0),
+            headers={"Content-Type": "application/json"},
+        )
+        self._request_ids = itertools.count(1)
+
+    def _call(self, service: str, method: str, *args: Any) -> Any:
+        """Call a service method and return its result"""
+        payload = build_jsonrpc_request(service, method, args, next(self._request_ids))
+        response = self.client.post("/jsonrpc", content=payload)
+        response.raise_for_status()
+        return parse_jsonrpc_response(response.content)
+
+    def authenticate(self, db: str, username: str, password: str) -> int | bool:
+        return self._call("common", "authenticate", db, username, password, {})
+
+    def execute_kw(
+        self, db: str, uid: int, password: str, model: str, method: str, args: list, kwargs: dict
+    ) -> Any:
+        return self._call("object", "execute_kw", db, uid, password, model, method, args, kwargs)
+
+    def close(self) -> None:
+        self.client.close()
+
+
+TRANSPORTS: dict[str, type[OdooTransport]] = {
+    "xmlrpc": XmlRpcTransport,
+    "jsonrpc": JsonRpcTransport,
+}
+
+
+def create_transport(name: str, url: str) -> OdooTransport:
+    """Create the transport registered under name ('xmlrpc' or 'jsonrpc')"""
+    if name not in TRANSPORTS:
+        raise ValueError(f"Unknown Odoo transport: {name}")
+    return TRANSPORTS[name](url)
+
+
+def is_auth_error(error: Exception) -> bool:
+    """Whether an RPC error means the cached uid/credentials were rejected"""
+    if isinstance(error, xmlrpc.client.Fault):
+        text = error.faultString
+    elif isinstance(error, OdooRpcError):
+        text = f"{error.name} {error}"
+    else:
+        return False
+    return any(marker in text for marker in ("AccessDenied", "Access Denied", "SessionExpired"))
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Whether an RPC error is worth retrying (timeouts, dropped workers, overload)"""
+    if isinstance(error, (TimeoutError, ConnectionError, http.client.HTTPException)):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in _TRANSIENT_HTTP_STATUSES
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, xmlrpc.client.ProtocolError):
+        return error.errcode in _TRANSIENT_HTTP_STATUSES
+    if isinstance(error, xmlrpc.client.Fault):
+        text = error.faultString
+    elif isinstance(error, OdooRpcError):
+        text = f"{error.name} {error}"
+    else:
+        return False
+    return any(marker in text for marker in _TRANSIENT_FAULT_MARKERS)
+
 
 class OdooClient:
-    """Client for interacting with Odoo XML-RPC API"""
+    """
+    Client for interacting with the Odoo external API (XML-RPC or JSON-RPC).
 
-    def __init__(self):
-        self.url = settings.odoo_url
-        self.db = settings.odoo_db
-        self.username = settings.odoo_username
-        self.password = settings.odoo_password
+    Thread-safe: transports keep per-thread or pooled connections and
+    authentication is serialized, so one instance can be shared process-wide
+    (see OdooClientRegistry). All calls go through an OdooGovernor, which
+    retries transient faults and adapts page size and concurrency to how
+    Odoo is coping.
+    """
+
+    def __init__(
+        self,
+        transport: OdooTransport | None = None,
+        url: str | None = None,
+        db: str | None = None,
+        username: str | None = None,
+        password: str | None = None,
+        governor: OdooGovernor | None = None,
+    ):
+        self.url = url or settings.odoo_url
+        self.db = db or settings.odoo_db
+        self.username = username or settings.odoo_username
+        self.password = password or settings.odoo_password
         self.uid: int | None = None
-        self.common = xmlrpc.client.ServerProxy(f"{self.url}/xmlrpc/2/common")
-        self.models = xmlrpc.client.ServerProxy(f"{self.url}/xmlrpc/2/object")
+        self.transport = transport or create_transport(settings.odoo_transport, self.url)
+        self._auth_lock = threading.Lock()
+        self.governor = governor or OdooGovernor()
+        self._country_names: dict[int, str] | None = None
 
     def authenticate(self) -> int:
         """
         Authenticate with Odoo and return user ID.
         Raises exception if authentication fails.
         """
-        try:
-            self.uid = self.common.authenticate(self.db, self.username, self.password, {})
-            if not self.uid:
-                raise Exception("Authentication failed: Invalid credentials")
-            logger.info(f"Successfully authenticated with Odoo. User ID: {self.uid}")
-            return self.uid
-        except Exception as e:
-            logger.error(f"Odoo authentication error: {e}")
-            raise
+        with self._auth_lock:
+            try:
+                self.uid = self.transport.authenticate(self.db, self.username, self.password)
+                if not self.uid:
+                    raise Exception("Authentication failed: Invalid credentials")
+                logger.info(f"Successfully authenticated with Odoo. User ID: {self.uid}")
+                return self.uid
+            except Exception as e:
+                logger.error(f"Odoo authentication error: {e}")
+                raise
 
-    def _execute_kw(self, model: str, method: str, args: list, kwargs: dict | None = None) -> Any:
+    def _execute_kw(
+        self,
+        model: str,
+        method: str,
+        args: list,
+        kwargs: dict | None = None,
+        *,
+        paged: bool = False,
+    ) -> Any:
         """
         Execute a method on an Odoo model.
-        Automatically authenticates if not already authenticated.
-        """
-        if not self.uid:
-            self.authenticate()
+        Automatically authenticates if not already authenticated, and
+        re-authenticates once if the cached credentials are rejected.
 
+        Read-only calls are retried with jittered exponential backoff on
+        transient faults (timeouts, dropped connections, 502/503/504,
+        serialization failures), up to ``odoo_max_retries`` times.
+
+        Args:
+            paged: The call reads one page; its latency tunes the page size
+        """
         if kwargs is None:
             kwargs = {}
+        max_retries = settings.odoo_max_retries if method in RETRYABLE_METHODS else 0
 
+        attempt = 0
+        while True:
+            try:
+                with self.governor.slot():
+                    started = time.monotonic()
+                    result = self._execute_kw_once(model, method, args, kwargs)
+                self.governor.on_success(time.monotonic() - started, paged=paged)
+                return result
+            except Exception as e:
+                if attempt >= max_retries or not is_transient_error(e):
+                    logger.error(f"Error executing {method} on {model}: {e}")
+                    raise
+                self.governor.on_failure(f"{type(e).__name__} on {model}.{method}")
+                delay = self.governor.backoff(attempt)
+                attempt += 1
+                logger.warning(
+                    f"Transient error executing {method} on {model} ({e}), "
+                    f"retry {attempt}/{max_retries} in {delay:.1f}s"
+                )
+                time.sleep(delay)
+
+    def _execute_kw_once(self, model: str, method: str, args: list, kwargs: dict) -> Any:
+        """Single execute_kw call, re-authenticating once if credentials are rejected"""
+        uid = self.uid or self.authenticate()
         try:
-            return self.models.execute_kw(
-                self.db, self.uid, self.password, model, method, args, kwargs
+            return self.transport.execute_kw(
+                self.db, uid, self.password, model, method, args, kwargs
             )
         except Exception as e:
-            logger.error(f"Error executing {method} on {model}: {e}")
-            raise
+            if not is_auth_error(e):
+                raise
+            logger.warning(f"Odoo rejected cached credentials ({e}), re-authenticating")
+            uid = self.authenticate()
+            return self.transport.execute_kw(
+                self.db, uid, self.password, model, method, args, kwargs
+            )
+
+    def close(self) -> None:
+        """Close the underlying transport connections"""
+        self.transport.close()
+
+    def iter_search_read(
+        self, model: str, domain: list, fields: list[str], page_size: int | None = None
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Page through search_read results using id keyset pagination.
+
+        Each page is requested as ``domain AND id > last_seen_id`` ordered by id,
+        so pages stay cheap for Odoo regardless of depth and only one page is
+        held in memory at a time.
+
+        Args:
+            model: Odoo model name
+            domain: Odoo domain filter
+            fields: Fields to read
+            page_size: Fixed records per page (default: adapted by the governor)
+
+        Yields:
+            Lists of record dictionaries, in ascending id order
+        """
+        last_id = 0
+        total = 0
+
+        while True:
+            limit = page_size or self.governor.page_size
+            page = self._execute_kw(
+                model,
+                "search_read",
+                [[*domain, ["id", ">", last_id]]],
+                {"fields": fields, "limit": limit, "order": "id asc", **RAW_READ_OPTIONS},
+                paged=True,
+            )
+            if not page:
+                break
+
+            total += len(page)
+            logger.debug(f"Fetched page of {len(page)} {model} records (after id {last_id})")
+            yield page
+
+            if len(page) < limit:
+                break
+            last_id = page[-1]["id"]
+
+        logger.info(f"Fetched {total} {model} records from Odoo")
+
+    def _iter_pages(
+        self, model: str, domain: list, fields: list[str], page_size: int | None = None
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Stream pages sequentially or in parallel depending on configured workers"""
+        if settings.odoo_fetch_workers > 1:
+            return self.iter_search_read_parallel(model, domain, fields, page_size)
+        return self.iter_search_read(model, domain, fields, page_size)
+
+    def iter_search_read_parallel(
+        self,
+        model: str,
+        domain: list,
+        fields: list[str],
+        page_size: int | None = None,
+        workers: int | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Fetch search_read results as concurrent id-range pages.
+
+        A cheap ``search`` returns the matching ids, which are split into
+        contiguous ranges of ``page_size`` ids (sized by the governor as ranges
+        are scheduled, unless fixed). Each range is then fetched with
+        its own ``search_read`` call on a thread pool, with at most twice as many
+        pages in flight as workers to keep memory bounded. Pages are yielded in
+        range order, so every id below a yielded page has been delivered.
+
+        Args:
+            model: Odoo model name
+            domain: Odoo domain filter
+            fields: Fields to read
+            page_size: Fixed records per page (default: adapted by the governor)
+            workers: Concurrent requests (default: settings.odoo_fetch_workers)
+
+        Yields:
+            Lists of record dictionaries, in ascending id order
+        """
+        workers = workers or settings.odoo_fetch_workers
+
+        if not self.uid:
+            self.authenticate()
+
+        ids = array("q", self._execute_kw(model, "search", [domain], {"order": "id asc"}))
+        logger.info(f"Fetching {len(ids)} {model} records with {workers} workers")
+        next_index = 0
+
+        def next_range() -> tuple[int, int] | None:
+            nonlocal next_index
+            if next_index >= len(ids):
+                return None
+            end = min(next_index + (page_size or self.governor.page_size), len(ids))
+            id_range = (ids[next_index], ids[end - 1])
+            next_index = end
+            return id_range
+
+        def fetch_range(first_id: int, last_id: int) -> list[dict[str, Any]]:
+            range_domain = [*domain, ["id", ">=", first_id], ["id", "<=", last_id]]
+            return self._execute_kw(
+                model,
+                "search_read",
+                [range_domain],
+                {"fields": fields, "order": "id asc", **RAW_READ_OPTIONS},
+                paged=True,
+            )
+
+        pending: deque[Future] = deque()
+        total = 0
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="odoo-fetch") as pool:
+
+            def submit_next() -> None:
+                id_range = next_range()
+                if id_range is not None:
+                    pending.append(pool.submit(fetch_range, *id_range))
+
+            try:
+                for _ in range(workers * 2):
+                    submit_next()
+
+                while pending:
+                    page = pending.popleft().result()
+                    submit_next()
+                    total += len(page)
+                    yield page
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        logger.info(f"Fetched {total} {model} records from Odoo")
+
+    def iter_by_ids(
+        self,
+        model: str,
+        odoo_ids: list[int],
+        fields: list[str],
+        domain: list | None = None,
+        batch_size: int | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Fetch specific records with one ``id in [...]`` search_read per batch.
+
+        Records that no longer exist (or no longer match the domain) are
+        simply absent from the results.
+
+        Args:
+            model: Odoo model name
+            odoo_ids: IDs to fetch
+            fields: Fields to read
+            domain: Extra domain the records must match
+            batch_size: IDs per call (default: the governor's page size)
+
+        Yields:
+            Lists of record dictionaries
+        """
+        start = 0
+        while start < len(odoo_ids):
+            size = batch_size or self.governor.page_size
+            batch = odoo_ids[start : start + size]
+            start += size
+            yield self._execute_kw(
+                model,
+                "search_read",
+                [[*(domain or []), ["id", "in", batch]]],
+                {"fields": fields, "order": "id asc", **RAW_READ_OPTIONS},
+                paged=True,
+            )
 
     def fetch_contacts(
         self, limit: int | None = None, offset: int = 0, domain: list | None = None
@@ -70,18 +560,7 @@ class OdooClient:
         if domain is None:
             domain = []
 
-        fields = [
-            "id",
-            "name",
-            "email",
-            "phone",
-            "street",
-            "city",
-            "country_id",
-            "write_date",
-        ]
-
-        kwargs = {"fields": fields, "offset": offset}
+        kwargs = {"fields": CONTACT_FIELDS, "offset": offset}
         if limit:
             kwargs["limit"] = limit
 
@@ -103,29 +582,34 @@ class OdooClient:
         Returns:
             Contact dictionary or None if not found
         """
-        fields = [
-            "id",
-            "name",
-            "email",
-            "phone",
-            "street",
-            "city",
-            "country_id",
-            "write_date",
-        ]
 
         try:
             contacts = self._execute_kw(
                 "res.partner",
                 "search_read",
                 [[["id", "=", odoo_id]]],
-                {"fields": fields},
+                {"fields": CONTACT_FIELDS},
             )
             return contacts[0] if contacts else None
         except Exception as e:
             logger.error(f"Error fetching contact {odoo_id}: {e}")
             return None
 
+    def iter_contacts(
+        self, domain: list | None = None, page_size: int | None = None
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Stream contacts (partners) from Odoo page by page.
+
+        Args:
+            domain: Odoo domain filter
+            page_size: Records per page
+
+        Yields:
+            Pages of contact dictionaries
+        """
+        yield from self._iter_pages("res.partner", domain or [], CONTACT_FIELDS, page_size)
+
     def fetch_invoices(
         self, limit: int | None = None, offset: int = 0, domain: list | None = None
     ) -> list[dict[str, Any]]:
@@ -143,18 +627,7 @@ class OdooClient:
         if domain is None:
             domain = []
 
-        fields = [
-            "id",
-            "name",  # invoice number
-            "partner_id",
-            "invoice_date",
-            "invoice_date_due",
-            "amount_total",
-            "state",
-            "write_date",
-        ]
-
-        kwargs = {"fields": fields, "offset": offset}
+        kwargs = {"fields": INVOICE_FIELDS, "offset": offset}
         if limit:
             kwargs["limit"] = limit
 
@@ -176,51 +649,167 @@ class OdooClient:
         Returns:
             Invoice dictionary or None if not found
         """
-        fields = [
-            "id",
-            "name",
-            "partner_id",
-            "invoice_date",
-            "invoice_date_due",
-            "amount_total",
-            "state",
-            "write_date",
-        ]
 
         try:
             invoices = self._execute_kw(
                 "account.move",
                 "search_read",
                 [[["id", "=", odoo_id]]],
-                {"fields": fields},
+                {"fields": INVOICE_FIELDS},
             )
             return invoices[0] if invoices else None
         except Exception as e:
             logger.error(f"Error fetching invoice {odoo_id}: {e}")
             return None
 
-    def get_all_contact_ids(self) -> list[int]:
+    def iter_invoices(
+        self, domain: list | None = None, page_size: int | None = None
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Stream invoices from Odoo page by page.
+
+        Args:
+            domain: Odoo domain filter
+            page_size: Records per page
+
+        Yields:
+            Pages of invoice dictionaries
+        """
+        yield from self._iter_pages("account.move", domain or [], INVOICE_FIELDS, page_size)
+
+    def get_all_contact_ids(self, domain: list | None = None) -> list[int]:
         """
         Get all contact IDs from Odoo.
-        Useful for detecting deletions.
+        Useful for detecting deletions: transfers ids only, no field data.
+
+        Args:
+            domain: Odoo domain filter
         """
         try:
-            ids = self._execute_kw("res.partner", "search", [[]])
+            ids = self._execute_kw("res.partner", "search", [domain or []])
             logger.info(f"Found {len(ids)} total contacts in Odoo")
             return ids
         except Exception as e:
             logger.error(f"Error fetching contact IDs: {e}")
             raise
 
-    def get_all_invoice_ids(self) -> list[int]:
+    def get_all_invoice_ids(self, domain: list | None = None) -> list[int]:
         """
         Get all invoice IDs from Odoo.
-        Useful for detecting deletions.
+        Useful for detecting deletions: transfers ids only, no field data.
+
+        Args:
+            domain: Odoo domain filter
         """
         try:
-            ids = self._execute_kw("account.move", "search", [[]])
+            ids = self._execute_kw("account.move", "search", [domain or []])
             logger.info(f"Found {len(ids)} total invoices in Odoo")
             return ids
         except Exception as e:
             logger.error(f"Error fetching invoice IDs: {e}")
             raise
+
+    def probe(self, model: str, domain: list) -> str:
+        """
+        Cheap change marker for the records matching a domain.
+
+        Combines ``search_count`` with the latest ``write_date`` (two small calls
+        that return no record data): any create, write or delete changes it.
+
+        Args:
+            model: Odoo model name
+            domain: Odoo domain filter
+        """
+        count = self._execute_kw(model, "search_count", [domain])
+        latest = self._execute_kw(
+            model,
+            "search_read",
+            [domain],
+            {"fields": ["write_date"], "order": "write_date desc", "limit": 1},
+        )
+        write_date = latest[0]["write_date"] if latest else ""
+        return f"{count}:{write_date}"
+
+    def get_country_names(self, refresh: bool = False) -> dict[int, str]:
+        """
+        Map of country ID to name, fetched once and cached on the client.
+
+        Args:
+            refresh: Re-fetch the countries (e.g. after seeing an unknown ID)
+        """
+        if self._country_names is None or refresh:
+            countries = self._execute_kw("res.country", "search_read", [[]], {"fields": ["name"]})
+            self._country_names = {country["id"]: country["name"] for country in countries}
+            logger.debug(f"Cached {len(self._country_names)} Odoo countries")
+        return self._country_names
+
+    def get_partner_names(self, partner_ids: list[int]) -> dict[int, str]:
+        """
+        Map of partner ID to name for the given partners, archived ones included.
+
+        Args:
+            partner_ids: Odoo partner IDs
+        """
+        if not partner_ids:
+            return {}
+        partners = self._execute_kw(
+            "res.partner",
+            "search_read",
+            [[["id", "in", partner_ids]]],
+            {"fields": ["name"], "context": {"active_test": False}},
+        )
+        return {partner["id"]: partner["name"] for partner in partners}
+
+
+class OdooClientRegistry:
+    """
+    Process-wide cache of Odoo clients keyed by (url, db, username).
+
+    Reusing clients keeps the authenticated uid and keep-alive connections
+    across sync runs instead of re-authenticating and reconnecting each time.
+    """
+
+    def __init__(self):
+        self._clients: dict[tuple[str, str, str], OdooClient] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        url: str | None = None,
+        db: str | None = None,
+        username: str | None = None,
+        password: str | None = None,
+    ) -> OdooClient:
+        """
+        Get the shared client for a connection, creating it on first use.
+
+        A client cached with another password is replaced, and closed so its
+        pooled connections are released.
+        """
+        url = url or settings.odoo_url
+        db = db or settings.odoo_db
+        username = username or settings.odoo_username
+        key = (url, db, username)
+
+        with self._lock:
+            stale = client = self._clients.get(key)
+            if client is None or (password and password != client.password):
+                client = OdooClient(url=url, db=db, username=username, password=password)
+                self._clients[key] = client
+            else:
+                stale = None
+        if stale is not None:
+            stale.close()
+        return client
+
+    def close_all(self) -> None:
+        """Close and forget all cached clients"""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+
+# Global client registry
+odoo_clients = OdooClientRegistry()
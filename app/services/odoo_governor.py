@@ -0,0 +1,121 @@
+"""
+Load governor for Odoo RPC calls.
+
+Keeps sync throughput close to what a (shared) Odoo instance can sustain:
+
+- in-flight calls are capped by an adaptive limit,
+- page sizes and the limit follow AIMD (additive increase while pages come
+  back under the target latency, multiplicative decrease on slow pages and
+  transient faults),
+- retries of transient faults wait with exponential backoff and full jitter.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import logging
+import random
+import threading
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for a single retry delay
+MAX_BACKOFF_SECONDS = 30.0
+
+
+class OdooGovernor:
+    """Thread-safe AIMD controller for page size and concurrent Odoo calls"""
+
+    def __init__(
+        self,
+        page_size: int | None = None,
+        min_page_size: int | None = None,
+        max_page_size: int | None = None,
+        max_concurrency: int | None = None,
+        target_latency: float | None = None,
+        backoff_seconds: float | None = None,
+    ):
+        self.min_page_size = min_page_size or settings.odoo_min_page_size
+        self.max_page_size = max(max_page_size or settings.odoo_max_page_size, self.min_page_size)
+        self.max_concurrency = max_concurrency or settings.odoo_max_concurrent_requests
+        self.target_latency = target_latency or settings.odoo_target_latency_seconds
+        self.backoff_seconds = backoff_seconds or settings.odoo_retry_backoff_seconds
+
+        self._page_size = self._clamp_page_size(page_size or settings.odoo_page_size)
+        self._concurrency = self.max_concurrency
+        self._in_flight = 0
+        self._successes = 0
+        self._condition = threading.Condition()
+
+    def _clamp_page_size(self, page_size: int) -> int:
+        return min(max(page_size, self.min_page_size), self.max_page_size)
+
+    @property
+    def page_size(self) -> int:
+        """Records to request in the next page"""
+        return self._page_size
+
+    @property
+    def concurrency(self) -> int:
+        """Current limit of concurrent Odoo calls"""
+        return self._concurrency
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one of the in-flight call slots, waiting while the limit is reached"""
+        with self._condition:
+            while self._in_flight >= self._concurrency:
+                self._condition.wait()
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify()
+
+    def on_success(self, latency: float, paged: bool = False) -> None:
+        """
+        Record a successful call.
+
+        Only page reads carry a latency signal (id searches and counts scale
+        with the table, not the page size).
+        """
+        if not paged:
+            return
+
+        with self._condition:
+            if latency > self.target_latency:
+                self._decrease(f"page took {latency:.1f}s", concurrency=False)
+                return
+
+            # Additive increase: one step of page size per fast page, one more
+            # concurrent call per window of successes at the current limit
+            if latency < self.target_latency / 2:
+                self._page_size = self._clamp_page_size(self._page_size + self.min_page_size)
+            self._successes += 1
+            if self._successes >= self._concurrency and self._concurrency < self.max_concurrency:
+                self._concurrency += 1
+                self._successes = 0
+                self._condition.notify_all()
+
+    def on_failure(self, reason: str) -> None:
+        """Record a transient fault: halve both page size and concurrency"""
+        with self._condition:
+            self._decrease(reason, concurrency=True)
+
+    def _decrease(self, reason: str, concurrency: bool) -> None:
+        """Multiplicative decrease (caller holds the condition lock)"""
+        self._page_size = self._clamp_page_size(self._page_size // 2)
+        if concurrency:
+            self._concurrency = max(1, self._concurrency // 2)
+        self._successes = 0
+        logger.info(
+            f"Backing off Odoo load ({reason}): page size {self._page_size}, "
+            f"concurrency {self._concurrency}"
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number ``attempt`` (0-based): exponential with full jitter"""
+        return random.uniform(0, min(MAX_BACKOFF_SECONDS, self.backoff_seconds * 2**attempt))
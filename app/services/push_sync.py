@@ -0,0 +1,181 @@
+"""
+Push sync: near-real-time syncing of records Odoo reports as changed.
+
+Change notifications are coalesced in memory per entity. A batch is synced
+once no notification arrived for ``webhook_debounce_seconds``, at the latest
+``webhook_max_delay_seconds`` after its first notification, or right away
+when ``webhook_max_batch_size`` records are pending. Each entity is then
+re-fetched with batched ``id in [...]`` reads through its sync strategy,
+holding the entity's sync lock; with ``sync_queue_enabled`` the batch is
+queued as sync jobs for the app.worker processes instead.
+
+Records of an entity that is being synced elsewhere are held back and
+retried with exponential backoff, up to ``webhook_max_postpone_seconds``.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+import logging
+import threading
+import time
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.repositories.sync_job_repository import SyncJobRepository
+from app.services.sync_orchestrator import SyncAlreadyRunningError, SyncOrchestrator
+
+logger = logging.getLogger(__name__)
+
+
+class PushSyncCoalescer:
+    """Thread-safe debouncer of (entity, odoo_id) change notifications"""
+
+    def __init__(
+        self,
+        debounce_seconds: float | None = None,
+        max_delay_seconds: float | None = None,
+        max_batch_size: int | None = None,
+        max_postpone_seconds: float | None = None,
+    ):
+        self.debounce_seconds = debounce_seconds or settings.webhook_debounce_seconds
+        self.max_delay_seconds = max_delay_seconds or settings.webhook_max_delay_seconds
+        self.max_batch_size = max_batch_size or settings.webhook_max_batch_size
+        self.max_postpone_seconds = max_postpone_seconds or settings.webhook_max_postpone_seconds
+
+        self._pending: defaultdict[str, set[int]] = defaultdict(set)
+        self._pending_count = 0
+        self._first_at: float | None = None
+        self._timer: threading.Timer | None = None
+        # Entities found locked: consecutive postponements and when to retry them
+        self._postponements: dict[str, int] = {}
+        self._held_until: dict[str, float] = {}
+        self._lock = threading.Lock()
+        # Batches are synced one at a time, in notification order
+        self._flush_lock = threading.Lock()
+
+    def add(self, changes: Iterable[tuple[str, int]]) -> None:
+        """Queue changed records and (re)schedule the flush of the pending batch"""
+        with self._lock:
+            self._add(changes)
+            if not self._pending_count:
+                return
+
+            now = time.monotonic()
+            if self._first_at is None:
+                self._first_at = now
+            if self._pending_count >= self.max_batch_size:
+                delay = 0.0
+            else:
+                delay = min(self.debounce_seconds, self._first_at + self.max_delay_seconds - now)
+            self._schedule(max(delay, 0.0))
+
+    def _add(self, changes: Iterable[tuple[str, int]]) -> None:
+        """Merge records into the pending batch (caller holds the lock)"""
+        for entity_name, odoo_id in changes:
+            ids = self._pending[entity_name]
+            if odoo_id not in ids:
+                ids.add(odoo_id)
+                self._pending_count += 1
+
+    def _schedule(self, delay: float) -> None:
+        """Replace the pending flush timer (caller holds the lock)"""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self) -> None:
+        """Sync the pending batch now, on the calling thread (held entities excepted)"""
+        with self._flush_lock:
+            with self._lock:
+                now = time.monotonic()
+                pending = {
+                    entity_name: ids
+                    for entity_name, ids in self._pending.items()
+                    if self._held_until.get(entity_name, 0.0) <= now
+                }
+                for entity_name, ids in pending.items():
+                    del self._pending[entity_name]
+                    self._pending_count -= len(ids)
+                self._first_at = None
+                self._timer = None
+
+            try:
+                if pending and settings.sync_queue_enabled:
+                    self._enqueue(pending)
+                elif pending:
+                    self._sync(pending)
+            except Exception as e:
+                logger.error(f"Push sync failed: {e}", exc_info=True)
+            finally:
+                with self._lock:
+                    self._schedule_held()
+
+    def _schedule_held(self) -> None:
+        """Arm the timer for the earliest held entity, unless a flush is due anyway"""
+        if self._timer is not None or not self._pending:
+            return
+        retry_at = min(self._held_until.get(entity_name, 0.0) for entity_name in self._pending)
+        self._schedule(max(retry_at - time.monotonic(), 0.0))
+
+    @staticmethod
+    def _enqueue(pending: dict[str, set[int]]) -> None:
+        """Queue one record sync job per entity for the worker processes"""
+        db = SessionLocal()
+        try:
+            jobs = SyncJobRepository(db)
+            for entity_name, odoo_ids in pending.items():
+                jobs.enqueue_ids(entity_name, sorted(odoo_ids))
+        finally:
+            db.close()
+
+    def _sync(self, pending: dict[str, set[int]]) -> None:
+        """Sync the batch in this process, under each entity's sync lock"""
+        with SyncOrchestrator() as orchestrator:
+            for entity_name, odoo_ids in pending.items():
+                try:
+                    orchestrator.sync_ids(entity_name, sorted(odoo_ids))
+                except SyncAlreadyRunningError:
+                    self._postpone(entity_name, odoo_ids)
+                    continue
+                except Exception as e:
+                    logger.error(f"Push sync of {entity_name} failed: {e}")
+                with self._lock:
+                    self._postponements.pop(entity_name, None)
+                    self._held_until.pop(entity_name, None)
+
+    def _postpone(self, entity_name: str, odoo_ids: set[int]) -> None:
+        """Hold back records of an entity that is being synced elsewhere, backing off"""
+        with self._lock:
+            postponements = self._postponements.get(entity_name, 0) + 1
+            self._postponements[entity_name] = postponements
+            delay = min(self.debounce_seconds * 2**postponements, self.max_postpone_seconds)
+            self._held_until[entity_name] = time.monotonic() + delay
+            self._add((entity_name, odoo_id) for odoo_id in odoo_ids)
+        logger.debug(f"{entity_name} is being synced, retrying push sync in {delay:.0f}s")
+
+    def stop(self) -> None:
+        """
+        Drop the pending batch without syncing it.
+
+        Those records are still picked up by the next scheduled incremental sync.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._pending_count:
+                logger.info(
+                    f"Dropping {self._pending_count} pending push sync records, "
+                    f"the next scheduled sync picks them up"
+                )
+            self._pending = defaultdict(set)
+            self._pending_count = 0
+            self._first_at = None
+            self._postponements.clear()
+            self._held_until.clear()
+
+
+# Global push sync instance
+push_sync = PushSyncCoalescer()
@@ -1,17 +1,69 @@
+import asyncio
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import logging
 import time
+import zlib
 
 from sqlalchemy.orm import Session
 
-from app.core.database import SessionLocal
+from app.core.config import settings
+from app.core.database import SessionLocal, advisory_lock
+from app.repositories.sync_job_repository import SyncJobRepository
 from app.schemas.sync import EntitySyncResult, FullSyncResult, SyncResult
+from app.services.async_odoo_client import AsyncOdooClient
 from app.services.contact_sync_strategy import ContactSyncStrategy
 from app.services.invoice_sync_strategy import InvoiceSyncStrategy
-from app.services.odoo_client import OdooClient
+from app.services.odoo_client import odoo_clients
 from app.services.sync_strategy import SyncStrategy
 
 logger = logging.getLogger(__name__)
 
+# Advisory lock key held by the process running a sync; the same key across
+# all API workers, replicas and CLI runs sharing the database
+SYNC_LOCK_KEY = 0x43686966740001
+
+
+class SyncAlreadyRunningError(RuntimeError):
+    """Another process (scheduler, CLI or worker) is syncing the entity"""
+
+
+@contextmanager
+def entity_lock(entity_name: str) -> Iterator[None]:
+    """
+    Hold the advisory lock of one entity while it is synced.
+
+    Every sync path takes it, so a queue worker, a CLI run, a webhook batch
+    and the API scheduler never write the same entity (watermark, checkpoint,
+    staging table, dead letters) at the same time.
+
+    Raises:
+        SyncAlreadyRunningError: If another process holds the lock
+    """
+    with advisory_lock(SYNC_LOCK_KEY + zlib.crc32(entity_name.encode())) as acquired:
+        if not acquired:
+            raise SyncAlreadyRunningError(f"{entity_name} sync already running in another process")
+        yield
+
+
+def enqueue_sync_jobs(entities: list[str] | None = None, full: bool | None = None) -> list[str]:
+    """
+    Queue one sync job per entity for the app.worker processes.
+
+    Entities already queued or running are left alone.
+
+    Returns:
+        Entities a new job was queued for
+    """
+    entity_names = list(SyncOrchestrator.strategy_classes) if entities is None else entities
+    db = SessionLocal()
+    try:
+        jobs = SyncJobRepository(db)
+        return [name for name in entity_names if jobs.enqueue(name, full=full)]
+    finally:
+        db.close()
+
 
 class SyncOrchestrator:
     """
@@ -19,9 +71,15 @@ class SyncOrchestrator:
     Eliminates code duplication and provides better separation of concerns.
     """
 
+    # Registered sync strategies, in sync order
+    strategy_classes: dict[str, type[SyncStrategy]] = {
+        "contacts": ContactSyncStrategy,
+        "invoices": InvoiceSyncStrategy,
+    }
+
     def __init__(self, db: Session | None = None):
         self.db = db or SessionLocal()
-        self.odoo_client = OdooClient()
+        self.odoo_client = odoo_clients.get()
         self.strategies: dict[str, SyncStrategy] = {}
 
         # Register sync strategies
@@ -29,27 +87,87 @@ class SyncOrchestrator:
 
     def _register_strategies(self):
         """Register all available sync strategies"""
-        self.strategies["contacts"] = ContactSyncStrategy(self.db, self.odoo_client)
-        self.strategies["invoices"] = InvoiceSyncStrategy(self.db, self.odoo_client)
+        for entity_name, strategy_class in self.strategy_classes.items():
+            self.strategies[entity_name] = strategy_class(self.db, self.odoo_client)
 
-    def sync_entity(self, entity_name: str) -> EntitySyncResult:
+    def _entity_names(self, entities: list[str] | None) -> list[str]:
+        """Validate an entity selection, keeping the registered sync order"""
+        if entities is None:
+            return list(self.strategies)
+        unknown = set(entities) - self.strategies.keys()
+        if unknown:
+            raise ValueError(
+                f"No sync strategy registered for entity: {', '.join(sorted(unknown))}"
+            )
+        return [name for name in self.strategies if name in entities]
+
+    def sync_entity(self, entity_name: str, full: bool | None = None) -> EntitySyncResult:
         """
         Sync a single entity type using its registered strategy.
 
         Args:
             entity_name: Name of entity to sync ('contacts' or 'invoices')
+            full: Force a full or incremental sync (default: decided by the strategy)
 
         Returns:
             EntitySyncResult with operation statistics
 
         Raises:
             ValueError: If entity strategy not found
+            SyncAlreadyRunningError: If another process is syncing the entity
         """
         if entity_name not in self.strategies:
             raise ValueError(f"No sync strategy registered for entity: {entity_name}")
 
         strategy = self.strategies[entity_name]
-        return strategy.sync()
+        with entity_lock(entity_name):
+            return strategy.sync(full=full)
+
+    def sync_ids(self, entity_name: str, odoo_ids: list[int]) -> EntitySyncResult:
+        """
+        Sync specific records of an entity, fetched by id in batches.
+
+        Raises:
+            ValueError: If entity strategy not found
+            SyncAlreadyRunningError: If another process is syncing the entity
+        """
+        if entity_name not in self.strategies:
+            raise ValueError(f"No sync strategy registered for entity: {entity_name}")
+        with entity_lock(entity_name):
+            return self.strategies[entity_name].sync_ids(odoo_ids)
+
+    def sweep_deletions(self, entity_name: str) -> EntitySyncResult:
+        """
+        Detect deletions for a single entity with an id-only Odoo search.
+
+        Raises:
+            ValueError: If entity strategy not found
+            SyncAlreadyRunningError: If another process is syncing the entity
+        """
+        if entity_name not in self.strategies:
+            raise ValueError(f"No sync strategy registered for entity: {entity_name}")
+        with entity_lock(entity_name):
+            return self.strategies[entity_name].sweep_deletions()
+
+    def sweep_all_deletions(self, entities: list[str] | None = None) -> FullSyncResult:
+        """
+        Run only the deletion sweep of the selected entities, one after another.
+
+        Args:
+            entities: Only sweep these entities (default: all)
+
+        Returns:
+            FullSyncResult with the deletions found per entity
+        """
+        start_time = time.time()
+        entity_results: dict[str, EntitySyncResult | None] = {}
+        for entity_name in self._entity_names(entities):
+            try:
+                entity_results[entity_name] = self.sweep_deletions(entity_name)
+            except Exception as e:
+                logger.error(f"Failed to sweep {entity_name} deletions: {e}")
+                entity_results[entity_name] = None
+        return self._build_full_result(entity_results, start_time)
 
     def sync_contacts(self) -> EntitySyncResult:
         """Sync contacts from Odoo to local database"""
@@ -69,33 +187,158 @@ class SyncOrchestrator:
         result = self.sync_invoices()
         return result.result.model_dump()
 
-    def sync_all(self) -> FullSyncResult:
+    def _sync_entity_isolated(self, entity_name: str, full: bool | None = None) -> EntitySyncResult:
+        """
+        Sync a single entity on its own database session.
+        Safe to run concurrently with other entities: the shared Odoo client
+        gives each thread its own connection.
+        """
+        db = SessionLocal()
+        try:
+            strategy = self.strategy_classes[entity_name](db, self.odoo_client)
+            with entity_lock(entity_name):
+                return strategy.sync(full=full)
+        finally:
+            db.close()
+
+    @staticmethod
+    def _run_safely(
+        sync_fn: Callable[[str, bool | None], EntitySyncResult],
+        entity_name: str,
+        full: bool | None,
+    ) -> EntitySyncResult | None:
+        """Run an entity sync, logging and swallowing failures"""
+        try:
+            return sync_fn(entity_name, full)
+        except Exception as e:
+            logger.error(f"Failed to sync {entity_name}: {e}")
+            return None
+
+    def sync_all(
+        self,
+        full: bool | None = None,
+        concurrent: bool | None = None,
+        entities: list[str] | None = None,
+    ) -> FullSyncResult:
         """
         Sync all registered entities.
 
+        Args:
+            full: Force a full or incremental sync (default: decided per strategy)
+            concurrent: Sync entities in parallel, each on its own session and Odoo
+                connection (default: when settings.sync_max_concurrency > 1)
+            entities: Only sync these entities (default: all)
+
         Returns:
             FullSyncResult with comprehensive results
         """
         start_time = time.time()
-        logger.info("Starting full sync...")
-        results = {}
-        success_count = 0
-        error_count = 0
+        if concurrent is None:
+            concurrent = settings.sync_max_concurrency > 1
+        entity_names = self._entity_names(entities)
+        logger.info(f"Starting full sync{' (concurrent)' if concurrent else ''}...")
+
+        if concurrent:
+            max_workers = max(1, min(settings.sync_max_concurrency, len(entity_names)))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sync") as pool:
+                futures = {
+                    entity_name: pool.submit(
+                        self._run_safely, self._sync_entity_isolated, entity_name, full
+                    )
+                    for entity_name in entity_names
+                }
+            entity_results = {name: future.result() for name, future in futures.items()}
+        else:
+            entity_results = {
+                entity_name: self._run_safely(self.sync_entity, entity_name, full)
+                for entity_name in entity_names
+            }
+
+        return self._build_full_result(entity_results, start_time)
 
-        for entity_name in self.strategies:
+    async def _async_sync_entity(
+        self, entity_name: str, odoo_client: AsyncOdooClient, full: bool | None
+    ) -> EntitySyncResult | None:
+        """Sync a single entity on its own session through the shared async client"""
+        db = SessionLocal()
+        # The lock is taken and released off the event loop
+        lock = entity_lock(entity_name)
+        try:
+            strategy = self.strategy_classes[entity_name](db, self.odoo_client)
+            await asyncio.to_thread(lock.__enter__)
             try:
-                entity_result = self.sync_entity(entity_name)
-                results[entity_name] = entity_result.result
+                return await strategy.async_sync(odoo_client, full=full)
+            finally:
+                await asyncio.to_thread(lock.__exit__, None, None, None)
+        except Exception as e:
+            logger.error(f"Failed to sync {entity_name}: {e}")
+            return None
+        finally:
+            db.close()
 
-                if entity_result.was_successful:
-                    success_count += 1
-                else:
-                    error_count += 1
+    async def async_sync_all(
+        self,
+        full: bool | None = None,
+        odoo_client: AsyncOdooClient | None = None,
+        entities: list[str] | None = None,
+    ) -> FullSyncResult:
+        """
+        Sync all registered entities concurrently on the running event loop.
 
-            except Exception as e:
-                logger.error(f"Failed to sync {entity_name}: {e}")
+        Args:
+            full: Force a full or incremental sync (default: decided per strategy)
+            odoo_client: Async client to fetch through (default: a new one for
+                this run, closed afterwards)
+            entities: Only sync these entities (default: all)
+
+        Returns:
+            FullSyncResult with comprehensive results
+        """
+        start_time = time.time()
+        entity_names = self._entity_names(entities)
+        logger.info("Starting full sync (async)...")
+
+        owns_client = odoo_client is None
+        if odoo_client is None:
+            # Reuse the uid and load budget of the shared sync client
+            odoo_client = AsyncOdooClient(
+                uid=self.odoo_client.uid, governor=self.odoo_client.governor
+            )
+        try:
+            entity_results = await asyncio.gather(
+                *(self._async_sync_entity(name, odoo_client, full) for name in entity_names)
+            )
+        finally:
+            if owns_client:
+                await odoo_client.aclose()
+
+        return self._build_full_result(
+            dict(zip(entity_names, entity_results, strict=True)), start_time
+        )
+
+    @staticmethod
+    def _build_full_result(
+        entity_results: dict[str, EntitySyncResult | None], start_time: float
+    ) -> FullSyncResult:
+        """Aggregate per-entity results (None for failed entities) into a FullSyncResult"""
+        results = {}
+        success_count = 0
+        error_count = 0
+        skipped_entities = []
+
+        for entity_name, entity_result in entity_results.items():
+            if entity_result is None:
                 results[entity_name] = SyncResult()
                 error_count += 1
+                continue
+
+            results[entity_name] = entity_result.result
+            if entity_result.skipped:
+                skipped_entities.append(entity_name)
+            if entity_result.was_successful:
+                success_count += 1
+            else:
+                error_count += 1
 
         total_duration = time.time() - start_time
         full_result = FullSyncResult(
@@ -103,15 +346,16 @@ class SyncOrchestrator:
             total_duration_seconds=total_duration,
             success_count=success_count,
             error_count=error_count,
+            skipped_entities=skipped_entities,
         )
 
         logger.info(
-            f"Full sync completed in {total_duration:.2f}s: {full_result.total_inserted} inserted, {full_result.total_updated} updated, {full_result.total_deleted} deleted, {full_result.total_errors} errors"
+            f"Full sync completed in {total_duration:.2f}s: {full_result.total_inserted} inserted, {full_result.total_updated} updated, {full_result.total_unchanged} unchanged, {full_result.total_deleted} deleted, {full_result.total_errors} errors, {len(skipped_entities)} skipped as unchanged"
         )
         return full_result
 
     def close(self):
-        """Close the database session"""
+        """Close the database session (the shared Odoo client stays open)"""
         if self.db:
             self.db.close()
 
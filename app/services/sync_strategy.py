@@ -1,118 +1,826 @@
 from abc import ABC, abstractmethod
+from array import array
+import asyncio
+from collections.abc import Iterator
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+import hashlib
 import logging
+import threading
 import time
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.models.sync_checkpoint import SyncCheckpoint
+from app.models.sync_state import SyncState
+from app.repositories.sync_checkpoint_repository import SyncCheckpointRepository
+from app.repositories.sync_dead_letter_repository import SyncDeadLetterRepository
+from app.repositories.sync_state_repository import SyncStateRepository
 from app.schemas.sync import EntitySyncResult, SyncResult
+from app.services.field_mapper import FieldMapper
+from app.services.id_set import IdSet
+from app.services.odoo_client import (
+    ODOO_DATETIME_FORMAT,
+    parse_odoo_datetime,
+    probe_write_date,
+)
 
 if TYPE_CHECKING:
     from app.repositories.contact_repository import ContactRepository
     from app.repositories.invoice_repository import InvoiceRepository
+    from app.services.async_odoo_client import AsyncOdooClient
 
 logger = logging.getLogger(__name__)
 
+# Set (e.g. on shutdown) to make running syncs stop at the next page boundary
+sync_stop_event = threading.Event()
+
+
+def compute_fingerprint(row: dict[str, Any]) -> str:
+    """
+    Hash the synced content of a mapped row.
+
+    Bookkeeping keys (``is_deleted``, ``fingerprint``) are excluded so the hash
+    only changes when data coming from Odoo changes.
+    """
+    content = repr(
+        sorted(
+            (key, value) for key, value in row.items() if key not in ("is_deleted", "fingerprint")
+        )
+    )
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+@dataclass
+class SyncRun:
+    """State of a single in-progress entity sync"""
+
+    entity_name: str
+    full: bool
+    domain: list
+    repository: Any
+    state_repository: SyncStateRepository
+    start_time: float = field(default_factory=time.time)
+    result: SyncResult = field(default_factory=SyncResult)
+    bulk: bool = False
+    sweep_deletions: bool = False
+    odoo_ids: array = field(default_factory=lambda: array("q"))
+    watermark: tuple[str, int] | None = None
+    # Odoo change marker taken before fetching, and whether it matched the last run
+    probe: str | None = None
+    # Latest Odoo write_date before fetching started: the saved watermark never
+    # passes it, as records written during the run may be in pages already fetched
+    write_date_bound: str | None = None
+    skipped: bool = False
+    # Full-run progress, checkpointed after every page
+    started_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    resumed: bool = False
+    last_odoo_id: int = 0
+    records_done: int = 0
+    # Dead-lettered Odoo IDs re-fetched before an incremental run
+    retry_ids: list[int] = field(default_factory=list)
+
 
 class SyncStrategy(ABC):
     """Abstract base class for sync strategies"""
 
+    # Odoo model and fields read by this strategy
+    odoo_model: str
+    odoo_fields: list[str]
+    # Odoo record -> database row mapping
+    mapper: FieldMapper
+
     def __init__(self, db: Session, odoo_client):
         self.db = db
         self.odoo_client = odoo_client
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Local Odoo IDs, loaded lazily by the row-by-row fallback
+        self._known_ids: IdSet | None = None
+        # Rows written in the currently open transaction
+        self._uncommitted_rows = 0
+        # Records that failed this run (latest error per Odoo ID), dead-lettered at the end
+        self._failures: dict[int, Exception] = {}
+        self._failure_count = 0
 
     @abstractmethod
-    def fetch_odoo_data(self) -> list[dict[str, Any]]:
-        """Fetch data from Odoo"""
+    def fetch_odoo_pages(self, domain: list) -> Iterator[list[dict[str, Any]]]:
+        """Stream data matching the domain from Odoo, one page at a time"""
+
+    @abstractmethod
+    def fetch_odoo_ids(self, domain: list) -> list[int]:
+        """Fetch only the IDs of records matching the domain from Odoo"""
+
+    def fetch_odoo_pages_by_ids(self, odoo_ids: list[int]) -> Iterator[list[dict[str, Any]]]:
+        """Re-fetch specific records from Odoo in batches"""
+        return self.odoo_client.iter_by_ids(
+            self.odoo_model, odoo_ids, self.odoo_fields, domain=self.get_domain()
+        )
 
     @abstractmethod
     def get_repository(self) -> "ContactRepository | InvoiceRepository":
         """Get the repository for this data type"""
 
-    @abstractmethod
-    def map_odoo_to_db(self, odoo_data: dict[str, Any]) -> dict[str, Any]:
-        """Map Odoo data to database schema"""
+    def map_page(self, odoo_items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Map a page of Odoo records to database rows"""
+        return self.mapper.map_batch(odoo_items)
+
+    async def prefetch_lookups(
+        self, odoo_client: "AsyncOdooClient", odoo_items: list[dict[str, Any]]
+    ) -> None:
+        """
+        Fetch the Odoo lookups map_page needs for a page through the async client.
+
+        async_sync awaits this before handing each page to a worker thread, so
+        map_page finds them cached instead of calling the blocking client.
+        Strategies without Odoo lookups have nothing to fetch.
+        """
+        return
 
     @abstractmethod
     def get_entity_name(self) -> str:
         """Get the name of the entity being synced"""
 
+    def get_domain(self) -> list:
+        """Get the base Odoo domain selecting records of this entity"""
+        return []
+
+    def _is_full_sync_due(self, state: SyncState | None) -> bool:
+        """Whether the next run should be a full reconciliation instead of incremental"""
+        if state is None or state.last_write_date is None or state.last_full_sync_at is None:
+            return True
+        interval = timedelta(hours=settings.full_sync_interval_hours)
+        return datetime.now(UTC) - state.last_full_sync_at >= interval
+
+    def _is_deletion_sweep_due(self, state: SyncState | None) -> bool:
+        """Whether deletions should be reconciled with an id-only sweep"""
+        if state is None or state.last_deletion_sweep_at is None:
+            return True
+        interval = timedelta(minutes=settings.deletion_sweep_interval_minutes)
+        return datetime.now(UTC) - state.last_deletion_sweep_at >= interval
+
+    @staticmethod
+    def _watermark_domain(state: SyncState) -> list:
+        """
+        Domain selecting records written after the stored (write_date, id) watermark.
+
+        Odoo stamps write_date when a transaction starts, so the watermark is
+        moved back by ``sync_watermark_lookback_seconds`` to pick up writes
+        committed late; re-reading the records in that window is cheap, as
+        unchanged rows are skipped by fingerprint.
+        """
+        lookback = timedelta(seconds=settings.sync_watermark_lookback_seconds)
+        last_write_date = state.last_write_date - lookback
+        write_date = last_write_date.astimezone(UTC).strftime(ODOO_DATETIME_FORMAT)
+        return [
+            "|",
+            ["write_date", ">", write_date],
+            "&",
+            ["write_date", "=", write_date],
+            ["id", ">", state.last_odoo_id or 0],
+        ]
+
+    @staticmethod
+    def _page_watermark(page: list[dict[str, Any]]) -> tuple[str, int] | None:
+        """Highest (write_date, id) pair in a page of Odoo records"""
+        return max(
+            ((item["write_date"], item["id"]) for item in page if item.get("write_date")),
+            default=None,
+        )
+
+    @staticmethod
+    def _run_watermark(run: SyncRun) -> tuple[str, int] | None:
+        """
+        Watermark to save for a completed run: the write_date bound taken before
+        fetching started, or, for incremental runs, the highest (write_date, id)
+        fetched if that is lower.
+
+        Pages arrive in id order, not write_date order, so a record written
+        mid-run may sit in a page fetched before a later page raised the
+        watermark past its write_date. Saving at most ``(bound, 0)`` makes the
+        next incremental run re-read everything written from the bound on.
+        """
+        if run.write_date_bound is None:
+            return None
+        bound = (run.write_date_bound, 0)
+        # A full run read every record written up to the bound
+        if run.full:
+            return bound
+        if run.watermark is None:
+            return None
+        return min(run.watermark, bound)
+
+    def _map_rows(self, odoo_items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Map Odoo records to database rows, including their content fingerprints"""
+        rows = self.map_page(odoo_items)
+        for row in rows:
+            row["fingerprint"] = compute_fingerprint(row)
+        return rows
+
+    def _map_row(self, odoo_item: dict[str, Any]) -> dict[str, Any]:
+        """Map a single Odoo record to a database row, including its content fingerprint"""
+        return self._map_rows([odoo_item])[0]
+
+    def _known_odoo_ids(self, repository: Any) -> IdSet:
+        """All locally stored Odoo IDs (including soft-deleted), loaded once per run"""
+        if self._known_ids is None:
+            self._known_ids = IdSet(repository.iter_odoo_ids(include_deleted=True))
+        return self._known_ids
+
     def _upsert_item(
         self, odoo_item: dict[str, Any], repository: Any, result: SyncResult, entity_name: str
     ) -> None:
-        """Process a single item (insert or update)"""
-        db_data = self.map_odoo_to_db(odoo_item)
-        existing = repository.get_by_odoo_id(odoo_item["id"])
+        """Process a single item (insert, update or skip if unchanged)"""
+        db_data = self._map_row(odoo_item)
+        # Ids not stored locally are known inserts and need no lookup
+        existing = None
+        if odoo_item["id"] in self._known_odoo_ids(repository):
+            existing = repository.get_by_odoo_id(odoo_item["id"])
 
-        if existing:
-            repository.update(existing, db_data)
+        if existing and existing.fingerprint == db_data["fingerprint"] and not existing.is_deleted:
+            result.unchanged += 1
+        elif existing:
+            repository.update(existing, db_data, commit=False)
             result.updated += 1
             self.logger.debug(f"Updated {entity_name}: {odoo_item.get('name', odoo_item['id'])}")
         else:
-            repository.create(db_data)
+            repository.create(db_data, commit=False)
             result.inserted += 1
             self.logger.debug(f"Inserted {entity_name}: {odoo_item.get('name', odoo_item['id'])}")
 
     def _process_upserts(
         self, odoo_data: list[dict[str, Any]], repository: Any, result: SyncResult, entity_name: str
     ) -> None:
-        """Process all insert/update operations"""
+        """
+        Process all insert/update operations in chunks of set-based upserts.
+
+        Chunks share one transaction, committed every ``sync_transaction_size``
+        rows and when the run finishes.
+        """
+        batch_size = settings.sync_batch_size
+        for start in range(0, len(odoo_data), batch_size):
+            chunk = odoo_data[start : start + batch_size]
+            self._upsert_chunk(chunk, repository, result, entity_name)
+            self._commit_if_due(len(chunk))
+
+    def _commit_if_due(self, rows: int) -> None:
+        """Commit the open transaction once it holds ``sync_transaction_size`` rows"""
+        self._uncommitted_rows += rows
+        if self._uncommitted_rows >= settings.sync_transaction_size:
+            self._commit()
+
+    def _commit(self) -> None:
+        """Commit the rows written so far in this run"""
+        self.db.commit()
+        self._uncommitted_rows = 0
+
+    def _upsert_chunk(
+        self, chunk: list[dict[str, Any]], repository: Any, result: SyncResult, entity_name: str
+    ) -> None:
+        """
+        Upsert a chunk of records in a single statement, inside a savepoint.
+
+        A failing chunk only rolls back to its savepoint, so earlier chunks in
+        the open transaction survive, and is then replayed row by row so one
+        bad record only fails itself.
+        """
+        try:
+            rows = self._map_rows(chunk)
+            with self.db.begin_nested():
+                counts = repository.bulk_upsert(rows, commit=False)
+        except Exception as e:
+            self.logger.warning(
+                f"Bulk upsert of {len(chunk)} {entity_name} records failed, "
+                f"falling back to row-by-row: {e}"
+            )
+            self._upsert_rows(chunk, repository, result, entity_name)
+            return
+
+        result.inserted += counts.inserted
+        result.updated += counts.updated
+        result.unchanged += counts.unchanged
+
+    def _upsert_rows(
+        self, odoo_data: list[dict[str, Any]], repository: Any, result: SyncResult, entity_name: str
+    ) -> None:
+        """Process insert/update operations one record at a time, each in its own savepoint"""
         for odoo_item in odoo_data:
             try:
-                self._upsert_item(odoo_item, repository, result, entity_name)
+                with self.db.begin_nested():
+                    self._upsert_item(odoo_item, repository, result, entity_name)
             except Exception as e:
-                result.add_error(f"Error processing {entity_name} {odoo_item.get('id')}: {e}")
+                self._record_failure(odoo_item, e, result, f"Error processing {entity_name}")
+
+    def _record_failure(
+        self, odoo_item: dict[str, Any], error: Exception, result: SyncResult, message: str
+    ) -> None:
+        """Count a failed record and remember it for the dead-letter table"""
+        result.add_error(f"{message} {odoo_item.get('id')}: {error}")
+        self._failure_count += 1
+        if odoo_item.get("id") is not None:
+            self._failures[odoo_item["id"]] = error
 
     def _process_soft_deletes(
-        self, deleted_ids: set[int], repository: Any, result: SyncResult, entity_name: str
+        self, odoo_ids: IdSet, repository: Any, result: SyncResult, entity_name: str
     ) -> None:
-        """Process all soft delete operations"""
-        for odoo_id in deleted_ids:
-            try:
-                item = repository.get_by_odoo_id(odoo_id)
-                if item and not item.is_deleted:
-                    repository.soft_delete(item)
-                    result.deleted += 1
-                    self.logger.debug(f"Soft deleted {entity_name}: {item}")
-            except Exception as e:
-                result.add_error(f"Error deleting {entity_name} {odoo_id}: {e}")
+        """
+        Soft-delete every local record whose Odoo ID is no longer present in Odoo.
+
+        The diff runs on compact sorted id arrays, so only the (usually few)
+        missing ids are sent back to the database, in a single statement.
+        """
+        try:
+            deleted_ids = IdSet(repository.iter_odoo_ids()) - odoo_ids
+            deleted = repository.soft_delete_odoo_ids(deleted_ids.tolist())
+        except Exception as e:
+            self.db.rollback()
+            result.add_error(f"Error deleting missing {entity_name} records: {e}")
+            return
 
-    def sync(self) -> EntitySyncResult:
-        """Execute the sync process using the strategy pattern"""
+        result.deleted += len(deleted)
+        if deleted:
+            self.logger.debug(f"Soft deleted {len(deleted)} {entity_name} records")
+
+    def _sweep_deletions(self, repository: Any, result: SyncResult, entity_name: str) -> None:
+        """Detect deletions by diffing an id-only Odoo search against the local table"""
+        try:
+            odoo_ids = self.fetch_odoo_ids(self.get_domain())
+        except Exception as e:
+            result.add_error(f"Error fetching {entity_name} IDs for deletion sweep: {e}")
+            return
+        self._process_soft_deletes(IdSet(odoo_ids), repository, result, entity_name)
+
+    def sweep_deletions(self) -> EntitySyncResult:
+        """
+        Run only the deletion detection phase.
+
+        Transfers ids only, so it can run on its own schedule independently of
+        the (incremental) data sync.
+        """
         start_time = time.time()
+        entity_name = self.get_entity_name()
         result = SyncResult()
+        self._sweep_deletions(self.get_repository(), result, entity_name)
+        if result.errors == 0:
+            SyncStateRepository(self.db).mark_deletion_sweep(entity_name)
+
+        duration = time.time() - start_time
+        self.logger.info(f"{entity_name} deletion sweep completed in {duration:.2f}s: {result}")
+        return EntitySyncResult(
+            entity_name=entity_name, result=result, duration_seconds=duration, full_sync=False
+        )
+
+    def sync_ids(self, odoo_ids: list[int]) -> EntitySyncResult:
+        """
+        Sync specific records, e.g. on change notifications from Odoo.
+
+        The records are re-fetched in batches and written through the regular
+        upsert path; requested ids Odoo no longer returns are soft-deleted.
+        The watermark is left alone, so scheduled runs still pick up every change.
+        """
+        start_time = time.time()
         entity_name = self.get_entity_name()
+        repository = self.get_repository()
+        result = SyncResult()
+        self._reset_run_state()
+        odoo_ids = sorted(set(odoo_ids))
 
+        fetched = array("q")
         try:
-            self.logger.info(f"Starting {entity_name} sync...")
+            for page in self.fetch_odoo_pages_by_ids(odoo_ids):
+                self._process_upserts(page, repository, result, entity_name)
+                fetched.extend(item["id"] for item in page)
+            SyncDeadLetterRepository(self.db).record(entity_name, self._failures, commit=False)
+            self._commit()
+            deleted = repository.soft_delete_odoo_ids((IdSet(odoo_ids) - IdSet(fetched)).tolist())
+        except Exception as e:
+            self.db.rollback()
+            self.logger.error(f"{entity_name} sync of {len(odoo_ids)} records failed: {e}")
+            raise
+        result.deleted += len(deleted)
 
-            # Fetch data from Odoo
-            odoo_data = self.fetch_odoo_data()
-            odoo_ids = {item["id"] for item in odoo_data}
+        duration = time.time() - start_time
+        self.logger.info(
+            f"{entity_name} sync of {len(odoo_ids)} records completed in {duration:.2f}s: {result}"
+        )
+        return EntitySyncResult(
+            entity_name=entity_name, result=result, duration_seconds=duration, full_sync=False
+        )
+
+    def _resumable_checkpoint(
+        self, checkpoint: SyncCheckpoint | None, repository: Any
+    ) -> SyncCheckpoint | None:
+        """The checkpoint if its run can still be resumed; stale ones are discarded"""
+        if checkpoint is None:
+            return None
+
+        age = datetime.now(UTC) - checkpoint.started_at
+        reason = None
+        if age >= timedelta(hours=settings.full_sync_interval_hours):
+            reason = f"started {age} ago"
+        elif checkpoint.bulk and repository.staged_count() != checkpoint.records_done:
+            reason = "staged rows were lost"
+        if reason is None:
+            return checkpoint
+
+        self.logger.info(f"Discarding {checkpoint.entity} sync checkpoint ({reason})")
+        SyncCheckpointRepository(self.db).delete(checkpoint.entity)
+        return None
+
+    def _reset_run_state(self) -> None:
+        """Forget the per-run caches and counters of a previous run"""
+        self._known_ids = None
+        self._uncommitted_rows = 0
+        self._failures = {}
+        self._failure_count = 0
+
+    def _start_run(
+        self, full: bool | None, bulk: bool | None = None, probe: str | None = None
+    ) -> SyncRun:
+        """
+        Resolve the sync mode and Odoo domain for a new run.
+
+        Args:
+            probe: Change marker already fetched (by async_sync, through the
+                async client); fetched here otherwise
+        """
+        entity_name = self.get_entity_name()
+        state_repository = SyncStateRepository(self.db)
+        state = state_repository.get(entity_name)
+        self._reset_run_state()
+
+        repository = self.get_repository()
+        if repository is None:
+            raise ValueError(f"Repository not found for {entity_name}")
+
+        # An unfinished full run is resumed before anything else
+        checkpoint = self._resumable_checkpoint(
+            SyncCheckpointRepository(self.db).get(entity_name), repository
+        )
+        if full is None:
+            full = checkpoint is not None or self._is_full_sync_due(state)
+        elif not full and (state is None or state.last_write_date is None):
+            # Nothing to be incremental from (cold start, or only empty runs so far)
+            self.logger.info(f"No {entity_name} watermark stored yet, running a full sync instead")
+            full = True
+
+        # Full runs re-read every record anyway; incremental runs retry the
+        # dead-lettered ones first, even when nothing changed in Odoo
+        retry_ids = []
+        if not full:
+            retry_ids = SyncDeadLetterRepository(self.db).get_retryable_ids(
+                entity_name, settings.sync_dead_letter_max_attempts
+            )
+
+        # A cheap count + latest write_date probe: if it matches the last successful
+        # run nothing was created, written or deleted, so incremental runs can skip.
+        # Its write_date also bounds the watermark this run may save.
+        if probe is None:
+            probe = self.odoo_client.probe(self.odoo_model, self.get_domain())
+        if (
+            settings.sync_skip_unchanged
+            and not full
+            and not retry_ids
+            and state is not None
+            and probe
+            and probe == state.probe_fingerprint
+        ):
+            return SyncRun(
+                entity_name=entity_name,
+                full=False,
+                domain=[],
+                repository=repository,
+                state_repository=state_repository,
+                probe=probe,
+                skipped=True,
+            )
+
+        domain = self.get_domain()
+        if not full:
+            domain = domain + self._watermark_domain(state)
+            checkpoint = None
+
+        if checkpoint is not None:
+            return self._resume_run(checkpoint, domain, repository, state_repository, probe)
+
+        # Bulk loading replaces the whole table, so it only applies to full runs;
+        # it is used automatically on cold start
+        if bulk is None:
+            bulk = full and (settings.sync_bulk_load or repository.is_empty())
+        bulk = bulk and full
+        if bulk:
+            repository.begin_bulk_load()
+
+        # Incremental fetches can't see deletions, so they run a separate
+        # id-only sweep on its own (slower) cadence
+        sweep_deletions = not full and self._is_deletion_sweep_due(state)
+
+        mode = "full" if full else "incremental"
+        self.logger.info(f"Starting {mode} {entity_name} sync{' (bulk load)' if bulk else ''}...")
+        return SyncRun(
+            entity_name=entity_name,
+            full=full,
+            domain=domain,
+            repository=repository,
+            state_repository=state_repository,
+            bulk=bulk,
+            sweep_deletions=sweep_deletions,
+            probe=probe,
+            write_date_bound=probe_write_date(probe),
+            retry_ids=retry_ids,
+        )
+
+    def _retry_dead_letters(self, run: SyncRun) -> None:
+        """
+        Re-fetch and upsert dead-lettered records by id.
+
+        Records that are stored now, or no longer exist in Odoo, leave the
+        dead-letter table; the ones failing again are recorded with the run.
+        """
+        if not run.retry_ids:
+            return
+
+        self.logger.info(f"Retrying {len(run.retry_ids)} dead-lettered {run.entity_name} records")
+        try:
+            for page in self.fetch_odoo_pages_by_ids(run.retry_ids):
+                self._process_upserts(page, run.repository, run.result, run.entity_name)
+        except Exception as e:
+            run.result.add_error(f"Error retrying dead-lettered {run.entity_name} records: {e}")
+            return
+
+        self._commit()
+        SyncDeadLetterRepository(self.db).resolve(
+            run.entity_name, [odoo_id for odoo_id in run.retry_ids if odoo_id not in self._failures]
+        )
+
+    def _resume_run(
+        self,
+        checkpoint: SyncCheckpoint,
+        domain: list,
+        repository: Any,
+        state_repository: SyncStateRepository,
+        probe: str | None,
+    ) -> SyncRun:
+        """
+        Continue an interrupted full run after its last checkpointed Odoo ID.
+
+        Only ids fetched by this attempt are known, so deletions are detected
+        with an id-only sweep instead of from the fetched pages. The write_date
+        bound stays the one taken before the first attempt: records written
+        since then (e.g. during the downtime) may be below the resume point.
+        """
+        if checkpoint.bulk:
+            repository.begin_bulk_load(truncate=False)
+
+        write_date_bound = None
+        if checkpoint.watermark_write_date is not None:
+            write_date_bound = checkpoint.watermark_write_date.astimezone(UTC).strftime(
+                ODOO_DATETIME_FORMAT
+            )
+
+        self.logger.info(
+            f"Resuming full {checkpoint.entity} sync after Odoo ID {checkpoint.last_odoo_id} "
+            f"({checkpoint.records_done} records done){' (bulk load)' if checkpoint.bulk else ''}..."
+        )
+        return SyncRun(
+            entity_name=checkpoint.entity,
+            full=True,
+            domain=[*domain, ["id", ">", checkpoint.last_odoo_id]],
+            repository=repository,
+            state_repository=state_repository,
+            bulk=checkpoint.bulk,
+            sweep_deletions=True,
+            probe=probe,
+            write_date_bound=write_date_bound,
+            started_at=checkpoint.started_at,
+            resumed=True,
+            last_odoo_id=checkpoint.last_odoo_id,
+            records_done=checkpoint.records_done,
+        )
+
+    def _process_page(self, run: SyncRun, page: list[dict[str, Any]]) -> None:
+        """Map and write one page of Odoo records"""
+        if run.bulk:
+            written = self._stage_page(run, page)
+        else:
+            self._process_upserts(page, run.repository, run.result, run.entity_name)
+            written = len(page)
 
-            # Get repository and existing IDs
-            repository = self.get_repository()
-            if repository is None:
-                raise ValueError(f"Repository not found for {entity_name}")
+        page_watermark = self._page_watermark(page)
+        if page_watermark and (run.watermark is None or page_watermark > run.watermark):
+            run.watermark = page_watermark
 
-            db_odoo_ids = set(repository.get_all_odoo_ids())
+        if run.full and page:
+            run.odoo_ids.extend(item["id"] for item in page)
+            run.last_odoo_id = max(run.last_odoo_id, page[-1]["id"])
+            run.records_done += written
+            self._save_checkpoint(run)
 
-            # Process upserts and deletes
-            self._process_upserts(odoo_data, repository, result, entity_name)
-            deleted_ids = db_odoo_ids - odoo_ids
-            self._process_soft_deletes(deleted_ids, repository, result, entity_name)
+    def _save_checkpoint(self, run: SyncRun) -> None:
+        """
+        Record full-run progress after a page.
 
-            duration = time.time() - start_time
-            log_msg = f"{entity_name} sync completed in {duration:.2f}s: {result}"
-            if result.error_details:
-                log_msg += f" | Errors: {', '.join(result.error_details)}"
-            self.logger.info(log_msg)
+        Upserted pages save the checkpoint in the open transaction, so it is only
+        committed together with (or after) the rows it covers; staged pages are
+        committed with their checkpoint right away.
+        """
+        watermark = None
+        if run.write_date_bound:
+            watermark = (parse_odoo_datetime(run.write_date_bound), 0)
+        SyncCheckpointRepository(self.db).save(
+            run.entity_name,
+            started_at=run.started_at,
+            bulk=run.bulk,
+            last_odoo_id=run.last_odoo_id,
+            records_done=run.records_done,
+            watermark=watermark,
+            commit=run.bulk,
+        )
+
+    def _interrupt_run(self, run: SyncRun) -> EntitySyncResult:
+        """Stop at a page boundary, committing the rows and checkpoint written so far"""
+        SyncDeadLetterRepository(self.db).record(run.entity_name, self._failures, commit=False)
+        self._commit()
+        duration = time.time() - run.start_time
+        if run.full:
+            self.logger.info(
+                f"{run.entity_name} sync stopped after Odoo ID {run.last_odoo_id} "
+                f"({run.records_done} records done), the next run resumes from there: {run.result}"
+            )
+        else:
+            self.logger.info(f"{run.entity_name} sync stopped early: {run.result}")
+        return EntitySyncResult(
+            entity_name=run.entity_name,
+            result=run.result,
+            duration_seconds=duration,
+            full_sync=run.full,
+            interrupted=True,
+        )
+
+    def _stage_page(self, run: SyncRun, page: list[dict[str, Any]]) -> int:
+        """Map a page and COPY it into the staging table (bulk load mode), returning rows staged"""
+        try:
+            rows = self._map_rows(page)
+        except Exception:
+            # Map row by row so only the bad records are left out
+            rows = []
+            for odoo_item in page:
+                try:
+                    rows.append(self._map_row(odoo_item))
+                except Exception as e:
+                    self._record_failure(
+                        odoo_item, e, run.result, f"Error mapping {run.entity_name}"
+                    )
+        run.repository.copy_rows(rows)
+        return len(rows)
+
+    def _finish_run(self, run: SyncRun) -> EntitySyncResult:
+        """Process deletions, persist the watermark and build the run result"""
+        result = run.result
+        dead_letters = SyncDeadLetterRepository(self.db)
+        dead_letters.record(run.entity_name, self._failures, commit=False)
+        # A complete fetch re-read every record, so only this run's failures remain
+        if run.full and not run.resumed:
+            dead_letters.resolve_all_except(run.entity_name, list(self._failures), commit=False)
+        self._commit()
+
+        # Records that failed to map are missing from staging, not deleted, so
+        # such a merge can't soft-delete what is missing; an id-only sweep does
+        sweep_deletions = run.sweep_deletions or (run.bulk and result.errors != 0)
+        if run.bulk:
+            counts = run.repository.merge_staging(soft_delete_missing=not sweep_deletions)
+            result.inserted += counts.inserted
+            result.updated += counts.updated
+            result.unchanged += counts.unchanged
+            result.deleted += counts.deleted
+        # A complete fetch in a single attempt doubles as the deletion sweep
+        elif run.full and not sweep_deletions:
+            self._process_soft_deletes(IdSet(run.odoo_ids), run.repository, result, run.entity_name)
+
+        if sweep_deletions:
+            self._sweep_deletions(run.repository, result, run.entity_name)
+
+        # Failed records are dead-lettered and retried by id, so they don't hold
+        # back the watermark; any other error (e.g. a failed sweep) does
+        unrecorded_errors = result.errors - self._failure_count
+        if (run.full or sweep_deletions) and unrecorded_errors == 0:
+            run.state_repository.mark_deletion_sweep(run.entity_name)
+
+        # Only advance the watermark if every record was stored or dead-lettered
+        if unrecorded_errors == 0:
+            write_date, odoo_id = None, None
+            watermark = self._run_watermark(run)
+            if watermark:
+                write_date, odoo_id = parse_odoo_datetime(watermark[0]), watermark[1]
+            run.state_repository.save_watermark(
+                run.entity_name,
+                write_date,
+                odoo_id,
+                full_sync=run.full,
+                probe_fingerprint=run.probe,
+            )
+        else:
+            self.logger.warning(
+                f"{run.entity_name} sync had errors, keeping previous watermark for retry"
+            )
+        if run.full:
+            SyncCheckpointRepository(self.db).delete(run.entity_name)
+
+        duration = time.time() - run.start_time
+        log_msg = f"{run.entity_name} sync completed in {duration:.2f}s: {result}"
+        if result.error_details:
+            log_msg += f" | Errors: {', '.join(result.error_details)}"
+        self.logger.info(log_msg)
+
+        return EntitySyncResult(
+            entity_name=run.entity_name,
+            result=result,
+            duration_seconds=duration,
+            full_sync=run.full,
+        )
+
+    def _skip_run(self, run: SyncRun) -> EntitySyncResult:
+        """Finish a run whose probe matched the last one, without fetching anything"""
+        run.state_repository.save_watermark(
+            run.entity_name, None, None, probe_fingerprint=run.probe
+        )
+        duration = time.time() - run.start_time
+        self.logger.info(
+            f"{run.entity_name} unchanged in Odoo since last sync, skipped in {duration:.2f}s"
+        )
+        return EntitySyncResult(
+            entity_name=run.entity_name,
+            result=run.result,
+            duration_seconds=duration,
+            full_sync=False,
+            skipped=True,
+        )
+
+    def sync(self, full: bool | None = None, bulk: bool | None = None) -> EntitySyncResult:
+        """
+        Execute the sync process using the strategy pattern.
+
+        Args:
+            full: Force a full (True) or incremental (False) run. By default a full
+                reconciliation runs when none has happened within
+                ``full_sync_interval_hours``, otherwise only records written since
+                the stored watermark are fetched.
+            bulk: Load a full run through COPY into a staging table and merge it
+                with set-based statements (default: on cold start or when
+                ``sync_bulk_load`` is set)
+        """
+        entity_name = self.get_entity_name()
+        try:
+            run = self._start_run(full, bulk)
+            if run.skipped:
+                return self._skip_run(run)
+            self._retry_dead_letters(run)
+
+            # Map and write each page as it arrives from Odoo
+            for page in self.fetch_odoo_pages(run.domain):
+                self._process_page(run, page)
+                if sync_stop_event.is_set():
+                    return self._interrupt_run(run)
+
+            return self._finish_run(run)
 
         except Exception as e:
-            result.add_error(f"{entity_name} sync failed: {e}")
+            self.db.rollback()
             self.logger.error(f"{entity_name} sync failed: {e}")
             raise
 
-        duration = time.time() - start_time
-        return EntitySyncResult(entity_name=entity_name, result=result, duration_seconds=duration)
+    async def async_sync(
+        self, odoo_client: "AsyncOdooClient", full: bool | None = None
+    ) -> EntitySyncResult:
+        """
+        Async variant of sync() fetching through an AsyncOdooClient.
+
+        Pages and their lookups are fetched concurrently on the event loop while
+        database writes run in a worker thread, one at a time, on this
+        strategy's session.
+        """
+        entity_name = self.get_entity_name()
+        try:
+            probe = await odoo_client.probe(self.odoo_model, self.get_domain())
+            run = await asyncio.to_thread(self._start_run, full, probe=probe)
+            if run.skipped:
+                return await asyncio.to_thread(self._skip_run, run)
+            await asyncio.to_thread(self._retry_dead_letters, run)
+
+            async with aclosing(
+                odoo_client.iter_search_read(self.odoo_model, run.domain, self.odoo_fields)
+            ) as pages:
+                async for page in pages:
+                    await self.prefetch_lookups(odoo_client, page)
+                    await asyncio.to_thread(self._process_page, run, page)
+                    if sync_stop_event.is_set():
+                        return await asyncio.to_thread(self._interrupt_run, run)
+
+            return await asyncio.to_thread(self._finish_run, run)
+
+        except Exception as e:
+            await asyncio.to_thread(self.db.rollback)
+            self.logger.error(f"{entity_name} sync failed: {e}")
+            raise
@@ -0,0 +1,176 @@
+"""
+Run a sync from the command line, outside the API process.
+
+Imports only the sync services (no FastAPI, routers or scheduler), so it
+starts quickly as a one-off job, e.g. a Kubernetes CronJob. Runs share the
+advisory locks of the API scheduler and the queue workers, so they never
+overlap another sync. With SYNC_QUEUE_ENABLED the selected entities are
+queued for the app.worker processes instead of synced here, so the tuning
+options (which only apply to a sync run here) are rejected.
+
+``--sweep-deletions`` only reconciles deletions with an id-only Odoo search,
+e.g. from a CronJob more frequent than DELETION_SWEEP_INTERVAL_MINUTES; it
+always runs here, under the entity locks.
+
+Usage:
+    python -m app.sync [--entity contacts] [--full | --incremental | --sweep-deletions] [--json]
+    # Or with uv:
+    uv run python -m app.sync --entity invoices --incremental --page-size 2000
+
+Exit status: 0 on success, 1 if any entity failed, 2 if another sync holds the
+lock, 3 if stopped by SIGTERM/SIGINT (at a page boundary; full runs resume from
+their checkpoint next time).
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import signal
+import sys
+
+from app.core.config import settings
+from app.core.database import advisory_lock
+from app.schemas.sync import FullSyncResult
+from app.services.sync_orchestrator import SYNC_LOCK_KEY, SyncOrchestrator, enqueue_sync_jobs
+from app.services.sync_strategy import sync_stop_event
+
+logger = logging.getLogger("app.sync")
+
+EXIT_LOCKED = 2
+EXIT_INTERRUPTED = 3
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m app.sync", description="Sync data from Odoo")
+    parser.add_argument(
+        "--entity",
+        action="append",
+        choices=list(SyncOrchestrator.strategy_classes),
+        dest="entities",
+        help="Entity to sync; repeat for several (default: all)",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--full", action="store_const", const=True, dest="full", help="Force a full reconciliation"
+    )
+    mode.add_argument(
+        "--incremental",
+        action="store_const",
+        const=False,
+        dest="full",
+        help="Only fetch records changed since the last run",
+    )
+    mode.add_argument(
+        "--sweep-deletions",
+        action="store_true",
+        help="Only soft-delete records that no longer exist in Odoo (id-only search)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help=f"Entities synced in parallel (default: {settings.sync_max_concurrency})",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        help=f"Rows per upsert statement (default: {settings.sync_batch_size})",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        help=f"Initial Odoo page size (default: {settings.odoo_page_size})",
+    )
+    parser.add_argument(
+        "--async",
+        action="store_true",
+        dest="use_async",
+        default=None,
+        help=f"Fetch through the asyncio JSON-RPC client (default: {settings.sync_async})",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the FullSyncResult as JSON on stdout"
+    )
+    args = parser.parse_args(argv)
+
+    # Queued jobs run in the app.worker processes, with their own settings
+    if settings.sync_queue_enabled and not args.sweep_deletions:
+        tuning = {
+            "--concurrency": args.concurrency,
+            "--batch-size": args.batch_size,
+            "--page-size": args.page_size,
+            "--async": args.use_async,
+        }
+        if given := [flag for flag, value in tuning.items() if value is not None]:
+            parser.error(
+                f"{', '.join(given)} cannot be used with SYNC_QUEUE_ENABLED: "
+                f"syncs are queued for the app.worker processes, configure those instead"
+            )
+    if args.use_async is None:
+        args.use_async = settings.sync_async
+    return args
+
+
+def apply_overrides(args: argparse.Namespace) -> None:
+    """Apply the tuning options to the settings read by the sync services"""
+    if args.concurrency is not None:
+        settings.sync_max_concurrency = args.concurrency
+    if args.batch_size is not None:
+        settings.sync_batch_size = args.batch_size
+    if args.page_size is not None:
+        settings.odoo_page_size = args.page_size
+
+
+def run(args: argparse.Namespace) -> FullSyncResult:
+    """Sync the selected entities"""
+    with SyncOrchestrator() as orchestrator:
+        if args.sweep_deletions:
+            return orchestrator.sweep_all_deletions(entities=args.entities)
+        if args.use_async:
+            return asyncio.run(orchestrator.async_sync_all(full=args.full, entities=args.entities))
+        return orchestrator.sync_all(full=args.full, entities=args.entities)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    # Logs go to stderr, so --json output on stdout stays machine-readable
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    apply_overrides(args)
+
+    if settings.sync_queue_enabled and not args.sweep_deletions:
+        queued = enqueue_sync_jobs(args.entities, full=args.full)
+        if args.json:
+            print(json.dumps({"queued": queued}))
+        else:
+            print(f"Queued sync jobs: {', '.join(queued) or 'none (all still queued or running)'}")
+        return 0
+
+    # Running syncs stop at their next page boundary and checkpoint their progress
+    def stop(signum, _frame):
+        logger.info(f"Received {signal.Signals(signum).name}, stopping...")
+        sync_stop_event.set()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    with advisory_lock(SYNC_LOCK_KEY) as acquired:
+        if not acquired:
+            logger.error("Another sync is running, exiting")
+            return EXIT_LOCKED
+        result = run(args)
+
+    if args.json:
+        print(result.model_dump_json(indent=2))
+    else:
+        for entity_name, entity_result in result.results.items():
+            print(f"{entity_name}: {entity_result}")
+        print(f"Completed in {result.total_duration_seconds:.2f}s")
+    if sync_stop_event.is_set():
+        return EXIT_INTERRUPTED
+    return 0 if result.error_count == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
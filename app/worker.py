@@ -0,0 +1,160 @@
+"""
+Sync worker: runs the entity syncs queued in the sync_jobs table.
+
+Start as many workers, on as many hosts, as needed: each claims pending jobs
+with SELECT ... FOR UPDATE SKIP LOCKED, renews its lease with heartbeats
+while syncing, and hands jobs of workers that stopped responding back to
+the queue. Each job holds its entity's advisory lock, so it never overlaps a
+CLI run or webhook batch of the same entity; jobs whose entity is busy are
+put back in the queue with a growing delay. Jobs are queued by the API scheduler and by
+``python -m app.sync`` when SYNC_QUEUE_ENABLED is set.
+
+Usage:
+    python -m app.worker
+    # Or with uv:
+    uv run python -m app.worker
+"""
+
+from datetime import UTC, datetime, timedelta
+import logging
+import os
+import signal
+import socket
+import threading
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.sync_job import SyncJob
+from app.repositories.sync_job_repository import SyncJobRepository
+from app.services.sync_orchestrator import SyncAlreadyRunningError, SyncOrchestrator
+from app.services.sync_strategy import sync_stop_event
+
+logger = logging.getLogger(__name__)
+
+
+class SyncWorker:
+    """Claims queued sync jobs and runs them until stopped"""
+
+    def __init__(self, worker_id: str | None = None):
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.db = SessionLocal()
+        self.jobs = SyncJobRepository(self.db)
+
+    def run(self) -> None:
+        """Process jobs until sync_stop_event is set (SIGTERM / SIGINT)"""
+        logger.info(f"Sync worker {self.worker_id} started")
+        try:
+            while not sync_stop_event.is_set():
+                try:
+                    self._reap()
+                    job = self.jobs.claim(self.worker_id)
+                except Exception as e:
+                    self.db.rollback()
+                    logger.error(f"Failed to poll the sync job queue: {e}")
+                    job = None
+
+                if job is None:
+                    sync_stop_event.wait(settings.sync_worker_poll_seconds)
+                    continue
+                self._run_job(job)
+        finally:
+            self.db.close()
+            logger.info(f"Sync worker {self.worker_id} stopped")
+
+    def _reap(self) -> None:
+        """Re-queue jobs of dead workers and drop old finished jobs"""
+        reaped = self.jobs.requeue_stale(
+            timedelta(seconds=settings.sync_job_stale_seconds), settings.sync_job_max_attempts
+        )
+        if reaped:
+            logger.warning(f"Reaped {reaped} sync jobs from workers that stopped responding")
+        self.jobs.delete_finished(
+            datetime.now(UTC) - timedelta(days=settings.sync_job_retention_days)
+        )
+
+    def _run_job(self, job: SyncJob) -> None:
+        """Sync the job's entity while a background thread keeps the lease alive"""
+        job_id, entity, full, attempts = job.id, job.entity, job.full, job.attempts
+        odoo_ids, queued_at = job.odoo_ids, job.created_at
+        logger.info(f"Running sync job {job_id} ({entity}, attempt {attempts})")
+
+        done = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(job_id, done), name=f"heartbeat-{job_id}", daemon=True
+        )
+        heartbeat.start()
+        try:
+            with SyncOrchestrator() as orchestrator:
+                if odoo_ids is not None:
+                    result = orchestrator.sync_ids(entity, odoo_ids)
+                else:
+                    result = orchestrator.sync_entity(entity, full=full)
+        except SyncAlreadyRunningError as e:
+            # A CLI run, webhook batch or the API scheduler holds the entity's lock:
+            # wait as long again as the job has been queued, so a long full sync
+            # is polled with exponential backoff rather than every poll interval
+            queued_for = (datetime.now(UTC) - queued_at).total_seconds()
+            delay = min(
+                max(queued_for, settings.sync_worker_poll_seconds),
+                settings.sync_job_max_postpone_seconds,
+            )
+            logger.info(f"Sync job {job_id} postponed by {delay:.0f}s: {e}")
+            self.jobs.finish(
+                job_id,
+                self.worker_id,
+                retry_after=timedelta(seconds=delay),
+                count_attempt=False,
+            )
+            return
+        except Exception as e:
+            logger.error(f"Sync job {job_id} ({entity}) failed: {e}", exc_info=True)
+            retry_after = None
+            if attempts < settings.sync_job_max_attempts:
+                retry_after = timedelta(seconds=settings.sync_worker_poll_seconds * 2**attempts)
+            self.jobs.finish(job_id, self.worker_id, error=str(e), retry_after=retry_after)
+            return
+        finally:
+            done.set()
+            heartbeat.join()
+
+        if result.interrupted:
+            # Stopped on shutdown: the next worker resumes from the checkpoint
+            self.jobs.finish(job_id, self.worker_id, retry_after=timedelta(0), count_attempt=False)
+        else:
+            self.jobs.finish(job_id, self.worker_id)
+        logger.info(f"Sync job {job_id} ({entity}) finished: {result.result}")
+
+    def _heartbeat(self, job_id: int, done: threading.Event) -> None:
+        """Renew the job lease until the sync returns (on its own session)"""
+        db = SessionLocal()
+        try:
+            jobs = SyncJobRepository(db)
+            while not done.wait(settings.sync_worker_heartbeat_seconds):
+                try:
+                    if not jobs.heartbeat(job_id, self.worker_id):
+                        logger.warning(f"Lost the lease on sync job {job_id}")
+                        return
+                except Exception as e:
+                    db.rollback()
+                    logger.error(f"Heartbeat for sync job {job_id} failed: {e}")
+        finally:
+            db.close()
+
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    # Running syncs stop at their next page boundary and checkpoint their progress
+    def stop(signum, _frame):
+        logger.info(f"Received {signal.Signals(signum).name}, stopping...")
+        sync_stop_event.set()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    SyncWorker().run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+from datetime import date
+import logging
+
+import pytest
+
+from app.services.contact_sync_strategy import ContactSyncStrategy
+from app.services.field_mapper import Field, FieldMapper, many2one_id
+from app.services.invoice_sync_strategy import InvoiceSyncStrategy
+
+
+def test_invoice_mapping_matches_the_hand_written_one():
+    invoices = [
+        {
+            "id": 1,
+            "name": "INV/2024/0001",
+            "partner_id": 7,
+            "invoice_date": "2024-03-01",
+            "invoice_date_due": "2024-03-31",
+            "amount_total": 121.0,
+            "state": "posted",
+        },
+        # Draft: no number, no dates, partner read as an (id, name) pair
+        {
+            "id": 2,
+            "name": False,
+            "partner_id": [8, "Acme"],
+            "invoice_date": False,
+            "invoice_date_due": False,
+            "amount_total": 0.0,
+            "state": "draft",
+        },
+        # Fields missing from the record fall back to their defaults
+        {"id": 3, "partner_id": False},
+    ]
+
+    assert InvoiceSyncStrategy.mapper.map_batch(invoices) == [
+        {
+            "odoo_id": 1,
+            "invoice_number": "INV/2024/0001",
+            "partner_id": 7,
+            "invoice_date": date(2024, 3, 1),
+            "due_date": date(2024, 3, 31),
+            "amount_total": 121.0,
+            "state": "posted",
+            "is_deleted": False,
+        },
+        {
+            "odoo_id": 2,
+            "invoice_number": "DRAFT-2",
+            "partner_id": 8,
+            "invoice_date": None,
+            "due_date": None,
+            "amount_total": 0.0,
+            "state": "draft",
+            "is_deleted": False,
+        },
+        {
+            "odoo_id": 3,
+            "invoice_number": "DRAFT-3",
+            "partner_id": None,
+            "invoice_date": None,
+            "due_date": None,
+            "amount_total": 0,
+            "state": "draft",
+            "is_deleted": False,
+        },
+    ]
+
+
+def test_contact_mapping_turns_empty_odoo_values_into_none():
+    contacts = [
+        {
+            "id": 1,
+            "name": "Jane",
+            "email": "jane@example.com",
+            "phone": False,
+            "street": "",
+            "city": "Ghent",
+        },
+        {"id": 2, "name": False, "email": False},
+    ]
+
+    assert ContactSyncStrategy.mapper.map_batch(contacts) == [
+        {
+            "odoo_id": 1,
+            "name": "Jane",
+            "email": "jane@example.com",
+            "phone": None,
+            "street": None,
+            "city": "Ghent",
+            "is_deleted": False,
+        },
+        {
+            "odoo_id": 2,
+            "name": "",
+            "email": None,
+            "phone": None,
+            "street": None,
+            "city": None,
+            "is_deleted": False,
+        },
+    ]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"), [(5, 5), ([5, "Belgium"], 5), ((5, "Belgium"), 5), (False, None)]
+)
+def test_many2one_id_accepts_bare_ids_and_pairs(value, expected):
+    assert many2one_id(value) == expected
+
+
+def test_required_field_missing_from_the_record_raises():
+    mapper = FieldMapper("contact", [Field("odoo_id", "id", required=True)])
+
+    with pytest.raises(KeyError):
+        mapper.map_batch([{"name": "Jane"}])
+
+
+def test_missing_values_are_reported_once_per_batch(caplog):
+    records = [{"id": 1, "name": False}, {"id": 2, "name": False}, {"id": 3, "name": "A"}]
+
+    with caplog.at_level(logging.WARNING, logger="app.services.field_mapper"):
+        InvoiceSyncStrategy.mapper.map_batch(records)
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "2 of 3 invoice records have no name (e.g. ids 1, 2)"
+    ]
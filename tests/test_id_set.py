@@ -0,0 +1,52 @@
+import pytest
+
+from app.services import id_set
+from app.services.id_set import IdSet
+
+
+@pytest.fixture(params=["numpy", "array merge"], autouse=True)
+def backend(request, monkeypatch):
+    """Run each test with NumPy (when installed) and with the pure-Python merge"""
+    if request.param == "numpy":
+        if id_set.np is None:
+            pytest.skip("NumPy is not installed")
+    else:
+        monkeypatch.setattr(id_set, "np", None)
+
+
+def test_unsorted_input_with_duplicates_is_sorted_and_deduplicated():
+    ids = IdSet([5, 3, 9, 3, 1, 9])
+
+    assert list(ids) == [1, 3, 5, 9]
+    assert len(ids) == 4
+
+
+def test_sorted_input_is_kept_as_is():
+    assert list(IdSet([1, 2, 10])) == [1, 2, 10]
+
+
+def test_difference():
+    assert list(IdSet([1, 2, 3, 4, 10]) - IdSet([2, 4, 5, 11])) == [1, 3, 10]
+
+
+def test_difference_with_an_empty_set():
+    ids = IdSet([3, 1, 2])
+
+    assert list(ids - IdSet()) == [1, 2, 3]
+    assert list(IdSet() - ids) == []
+    assert list(IdSet() - IdSet()) == []
+
+
+def test_membership():
+    ids = IdSet([7, 3])
+
+    assert 3 in ids
+    assert 7 in ids
+    assert 5 not in ids
+    assert 8 not in ids
+    assert 0 not in IdSet()
+
+
+@pytest.mark.parametrize("value", ["3", None, (3,), 3.5])
+def test_non_int_values_are_not_members(value):
+    assert value not in IdSet([3])
@@ -0,0 +1,98 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services import push_sync
+from app.services.push_sync import PushSyncCoalescer
+from app.services.sync_orchestrator import SyncAlreadyRunningError
+
+
+@pytest.fixture
+def clock():
+    """Monotonic clock of the push_sync module, set by the test"""
+    with patch.object(push_sync, "time") as time:
+        time.monotonic.return_value = 100.0
+        yield time
+
+
+@pytest.fixture
+def coalescer(clock):
+    """Coalescer recording the delays it schedules flushes at instead of starting timers"""
+    coalescer = PushSyncCoalescer(
+        debounce_seconds=2, max_delay_seconds=10, max_batch_size=3, max_postpone_seconds=6
+    )
+    coalescer._schedule = MagicMock(side_effect=lambda delay: setattr(coalescer, "_timer", delay))
+    return coalescer
+
+
+@pytest.fixture
+def orchestrator():
+    with patch.object(push_sync, "SyncOrchestrator") as orchestrator_class:
+        yield orchestrator_class.return_value.__enter__.return_value
+
+
+def scheduled_delays(coalescer: PushSyncCoalescer) -> list[float]:
+    return [call.args[0] for call in coalescer._schedule.call_args_list]
+
+
+def test_each_notification_restarts_the_debounce_delay(coalescer, clock):
+    coalescer.add([("contact", 1)])
+    clock.monotonic.return_value = 101.0
+    coalescer.add([("contact", 1), ("contact", 2)])
+
+    assert scheduled_delays(coalescer) == [2, 2]
+    assert coalescer._pending == {"contact": {1, 2}}
+
+
+def test_flush_is_due_at_most_max_delay_after_the_first_notification(coalescer, clock):
+    coalescer.add([("contact", 1)])
+    clock.monotonic.return_value = 109.5
+    coalescer.add([("contact", 2)])
+
+    assert scheduled_delays(coalescer) == [2, 0.5]
+
+
+def test_full_batch_is_flushed_right_away(coalescer):
+    coalescer.add([("contact", 1), ("contact", 2)])
+    coalescer.add([("invoice", 1)])
+
+    assert scheduled_delays(coalescer) == [2, 0]
+
+
+def test_flush_syncs_each_entity_by_id(coalescer, orchestrator):
+    coalescer.add([("contact", 2), ("contact", 1), ("invoice", 5)])
+    coalescer.flush()
+
+    assert [call.args for call in orchestrator.sync_ids.call_args_list] == [
+        ("contact", [1, 2]),
+        ("invoice", [5]),
+    ]
+    assert coalescer._pending_count == 0
+
+
+def test_locked_entity_is_held_back_with_exponential_backoff(coalescer, clock, orchestrator):
+    orchestrator.sync_ids.side_effect = SyncAlreadyRunningError("contact sync is already running")
+    coalescer.add([("contact", 1)])
+    coalescer.flush()
+
+    # Held for twice the debounce delay, with the ids kept pending
+    assert scheduled_delays(coalescer)[-1] == 4
+    assert coalescer._pending == {"contact": {1}}
+
+    # Flushes meanwhile (e.g. for new notifications) leave the held entity alone
+    clock.monotonic.return_value = 102.0
+    coalescer.add([("contact", 2)])
+    coalescer.flush()
+    assert orchestrator.sync_ids.call_count == 1
+
+    # Each retry that finds the lock held doubles the delay, up to the maximum
+    clock.monotonic.return_value = 104.0
+    coalescer.flush()
+    assert orchestrator.sync_ids.call_args.args == ("contact", [1, 2])
+    assert scheduled_delays(coalescer)[-1] == 6
+
+    orchestrator.sync_ids.side_effect = None
+    clock.monotonic.return_value = 110.0
+    coalescer.flush()
+    assert coalescer._pending_count == 0
+    assert coalescer._postponements == {}
@@ -0,0 +1,95 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.config import settings
+from app.repositories.sync_repository import WriteCounts
+from app.services import sync_strategy
+from app.services.contact_sync_strategy import ContactSyncStrategy
+
+
+@pytest.fixture
+def strategy():
+    """Contact strategy over a mocked session and Odoo client, with empty sync state"""
+    odoo_client = MagicMock()
+    odoo_client.probe.return_value = "0:"
+    contact_strategy = ContactSyncStrategy(MagicMock(), odoo_client)
+    contact_strategy.get_repository = MagicMock(return_value=MagicMock())
+    with (
+        patch.object(sync_strategy, "SyncStateRepository") as state_repository,
+        patch.object(sync_strategy, "SyncCheckpointRepository") as checkpoint_repository,
+        patch.object(sync_strategy, "SyncDeadLetterRepository"),
+    ):
+        state_repository.return_value.get.return_value = None
+        checkpoint_repository.return_value.get.return_value = None
+        yield contact_strategy
+
+
+def test_forced_incremental_run_without_state_falls_back_to_full(strategy):
+    run = strategy._start_run(full=False, bulk=False)
+
+    assert run.full is True
+    assert run.skipped is False
+    assert run.domain == strategy.get_domain()
+
+
+def test_bulk_run_with_failed_records_sweeps_deletions_before_marking_them(strategy):
+    run = strategy._start_run(full=True, bulk=True)
+    run.repository.merge_staging.return_value = WriteCounts()
+    strategy._record_failure({"id": 7}, ValueError("bad"), run.result, "Error mapping contact")
+    strategy._sweep_deletions = MagicMock()
+
+    strategy._finish_run(run)
+
+    run.repository.merge_staging.assert_called_once_with(soft_delete_missing=False)
+    strategy._sweep_deletions.assert_called_once()
+    run.state_repository.mark_deletion_sweep.assert_called_once_with(run.entity_name)
+
+
+def test_watermark_stops_at_the_write_date_bound_taken_before_fetching(strategy):
+    # Latest write_date in Odoo when the run starts
+    strategy.odoo_client.probe.return_value = "2:2024-01-01 10:00:00"
+    strategy._process_upserts = MagicMock()
+    strategy._process_soft_deletes = MagicMock()
+    run = strategy._start_run(full=True, bulk=False)
+
+    # Record 10 is fetched, then written at 10:01; record 5000 is written at
+    # 10:05 before its own page is fetched
+    strategy._process_page(run, [{"id": 10, "write_date": "2024-01-01 09:00:00"}])
+    strategy._process_page(run, [{"id": 5000, "write_date": "2024-01-01 10:05:00"}])
+    strategy._finish_run(run)
+
+    saved = run.state_repository.save_watermark.call_args
+    assert saved.args[1:] == (datetime(2024, 1, 1, 10, 0, tzinfo=UTC), 0)
+
+    # The next incremental run still fetches record 10's 10:01 write
+    state = MagicMock(last_write_date=saved.args[1], last_odoo_id=0)
+    with patch.object(settings, "sync_watermark_lookback_seconds", 0):
+        domain = strategy._watermark_domain(state)
+    assert domain[1] == ["write_date", ">", "2024-01-01 10:00:00"]
+
+
+def test_resumed_run_keeps_the_write_date_bound_of_its_first_attempt(strategy):
+    checkpoint = MagicMock(
+        entity="contact",
+        started_at=datetime.now(UTC) - timedelta(hours=1),
+        bulk=False,
+        last_odoo_id=100,
+        records_done=100,
+        watermark_write_date=datetime(2024, 1, 1, 10, 0, tzinfo=UTC),
+        watermark_odoo_id=0,
+    )
+    sync_strategy.SyncCheckpointRepository.return_value.get.return_value = checkpoint
+    # Records were written during the downtime, some of them below the resume point
+    strategy.odoo_client.probe.return_value = "200:2024-01-01 11:00:00"
+    strategy._process_upserts = MagicMock()
+    strategy._sweep_deletions = MagicMock()
+
+    run = strategy._start_run(full=None)
+    strategy._process_page(run, [{"id": 150, "write_date": "2024-01-01 10:30:00"}])
+    strategy._finish_run(run)
+
+    assert run.resumed is True
+    saved = run.state_repository.save_watermark.call_args
+    assert saved.args[1:] == (datetime(2024, 1, 1, 10, 0, tzinfo=UTC), 0)